@@ -0,0 +1,235 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: beam_artifact_api.proto
+"""Generated protocol buffer code."""
+from __future__ import absolute_import
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import message as _message
+from google.protobuf import reflection as _reflection
+from google.protobuf import symbol_database as _symbol_database
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from . import beam_runner_api_pb2 as beam__runner__api__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x17\x62\x65\x61m_artifact_api.proto\x12\'org.apache.beam.model.job_management.v1\x1a\x15\x62\x65\x61m_runner_api.proto\"|\n\x17ResolveArtifactsRequest\x12I\n\tartifacts\x18\x01 \x03(\x0b\x32\x36.org.apache.beam.model.pipeline.v1.ArtifactInformation\x12\x16\n\x0epreferred_urns\x18\x02 \x03(\t\"h\n\x18ResolveArtifactsResponse\x12L\n\x0creplacements\x18\x01 \x03(\x0b\x32\x36.org.apache.beam.model.pipeline.v1.ArtifactInformation\"^\n\x12GetArtifactRequest\x12H\n\x08\x61rtifact\x18\x01 \x01(\x0b\x32\x36.org.apache.beam.model.pipeline.v1.ArtifactInformation\"#\n\x13GetArtifactResponse\x12\x0c\n\x04\x64\x61ta\x18\x01 \x01(\x0c\"\xd8\x01\n\x16\x41rtifactRequestWrapper\x12]\n\x10resolve_artifact\x18\xe8\x07 \x01(\x0b\x32@.org.apache.beam.model.job_management.v1.ResolveArtifactsRequestH\x00\x12T\n\x0cget_artifact\x18\xe9\x07 \x01(\x0b\x32;.org.apache.beam.model.job_management.v1.GetArtifactRequestH\x00\x42\t\n\x07request\"\x96\x02\n\x17\x41rtifactResponseWrapper\x12\x15\n\rstaging_token\x18\x01 \x01(\t\x12\x0f\n\x07is_last\x18\x02 \x01(\x08\x12g\n\x19resolve_artifact_response\x18\xe8\x07 \x01(\x0b\x32\x41.org.apache.beam.model.job_management.v1.ResolveArtifactsResponseH\x00\x12^\n\x15get_artifact_response\x18\xe9\x07 \x01(\x0b\x32<.org.apache.beam.model.job_management.v1.GetArtifactResponseH\x00\x42\n\n\x08response\"E\n\x10\x41rtifactMetadata\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x13\n\x0bpermissions\x18\x02 \x01(\r\x12\x0e\n\x06sha256\x18\x04 \x01(\t\"W\n\x08Manifest\x12K\n\x08\x61rtifact\x18\x01 \x03(\x0b\x32\x39.org.apache.beam.model.job_management.v1.ArtifactMetadata\"\xce\x01\n\rProxyManifest\x12\x43\n\x08manifest\x18\x01 \x01(\x0b\x32\x31.org.apache.beam.model.job_management.v1.Manifest\x12Q\n\x08location\x18\x02 \x03(\x0b\x32?.org.apache.beam.model.job_management.v1.ProxyManifest.Location\x1a%\n\x08Location\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0b\n\x03uri\x18\x02 \x01(\t\"-\n\x12GetManifestRequest\x12\x17\n\x0fretrieval_token\x18\x01 \x01(\t\"Z\n\x13GetManifestResponse\x12\x43\n\x08manifest\x18\x01 \x01(\x0b\x32\x31.org.apache.beam.model.job_management.v1.Manifest\"A\n\x18LegacyGetArtifactRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x17\n\x0fretrieval_token\x18\x02 \x01(\t\"\x1d\n\rArtifactChunk\x12\x0c\n\x04\x64\x61ta\x18\x01 \x01(\x0c\"\x81\x01\n\x13PutArtifactMetadata\x12\x1d\n\x15staging_session_token\x18\x01 \x01(\t\x12K\n\x08metadata\x18\x02 \x01(\x0b\x32\x39.org.apache.beam.model.job_management.v1.ArtifactMetadata\"\xb9\x01\n\x12PutArtifactRequest\x12P\n\x08metadata\x18\x01 \x01(\x0b\x32<.org.apache.beam.model.job_management.v1.PutArtifactMetadataH\x00\x12\x46\n\x04\x64\x61ta\x18\x02 \x01(\x0b\x32\x36.org.apache.beam.model.job_management.v1.ArtifactChunkH\x00\x42\t\n\x07\x63ontent\"\x15\n\x13PutArtifactResponse\"{\n\x15\x43ommitManifestRequest\x12\x43\n\x08manifest\x18\x01 \x01(\x0b\x32\x31.org.apache.beam.model.job_management.v1.Manifest\x12\x1d\n\x15staging_session_token\x18\x02 \x01(\t\"|\n\x16\x43ommitManifestResponse\x12\x17\n\x0fretrieval_token\x18\x01 \x01(\t\"I\n\tConstants\x12<\n\x19NO_ARTIFACTS_STAGED_TOKEN\x10\x00\x1a\x1d\xaa\xb4\xfa\xc2\x05\x17__no_artifacts_staged__2\xc1\x02\n\x18\x41rtifactRetrievalService\x12\x97\x01\n\x10ResolveArtifacts\x12@.org.apache.beam.model.job_management.v1.ResolveArtifactsRequest\x1a\x41.org.apache.beam.model.job_management.v1.ResolveArtifactsResponse\x12\x8a\x01\n\x0bGetArtifact\x12;.org.apache.beam.model.job_management.v1.GetArtifactRequest\x1a<.org.apache.beam.model.job_management.v1.GetArtifactResponse0\x01\x32\xc3\x01\n\x16\x41rtifactStagingService\x12\xa8\x01\n\x1fReverseArtifactRetrievalService\x12@.org.apache.beam.model.job_management.v1.ArtifactResponseWrapper\x1a?.org.apache.beam.model.job_management.v1.ArtifactRequestWrapper(\x01\x30\x01\x32\xbf\x02\n\x1cLegacyArtifactStagingService\x12\x8a\x01\n\x0bPutArtifact\x12;.org.apache.beam.model.job_management.v1.PutArtifactRequest\x1a<.org.apache.beam.model.job_management.v1.PutArtifactResponse(\x01\x12\x91\x01\n\x0e\x43ommitManifest\x12>.org.apache.beam.model.job_management.v1.CommitManifestRequest\x1a?.org.apache.beam.model.job_management.v1.CommitManifestResponse2\xb8\x02\n\x1eLegacyArtifactRetrievalService\x12\x88\x01\n\x0bGetManifest\x12;.org.apache.beam.model.job_management.v1.GetManifestRequest\x1a<.org.apache.beam.model.job_management.v1.GetManifestResponse\x12\x8a\x01\n\x0bGetArtifact\x12\x41.org.apache.beam.model.job_management.v1.LegacyGetArtifactRequest\x1a\x36.org.apache.beam.model.job_management.v1.ArtifactChunk0\x01\x42\x86\x01\n&org.apache.beam.model.jobmanagement.v1B\x0b\x41rtifactApiZOgithub.com/apache/beam/sdks/go/pkg/beam/model/jobmanagement_v1;jobmanagement_v1b\x06proto3')
+
+
+
+_RESOLVEARTIFACTSREQUEST = DESCRIPTOR.message_types_by_name['ResolveArtifactsRequest']
+_RESOLVEARTIFACTSRESPONSE = DESCRIPTOR.message_types_by_name['ResolveArtifactsResponse']
+_GETARTIFACTREQUEST = DESCRIPTOR.message_types_by_name['GetArtifactRequest']
+_GETARTIFACTRESPONSE = DESCRIPTOR.message_types_by_name['GetArtifactResponse']
+_ARTIFACTREQUESTWRAPPER = DESCRIPTOR.message_types_by_name['ArtifactRequestWrapper']
+_ARTIFACTRESPONSEWRAPPER = DESCRIPTOR.message_types_by_name['ArtifactResponseWrapper']
+_ARTIFACTMETADATA = DESCRIPTOR.message_types_by_name['ArtifactMetadata']
+_MANIFEST = DESCRIPTOR.message_types_by_name['Manifest']
+_PROXYMANIFEST = DESCRIPTOR.message_types_by_name['ProxyManifest']
+_PROXYMANIFEST_LOCATION = _PROXYMANIFEST.nested_types_by_name['Location']
+_GETMANIFESTREQUEST = DESCRIPTOR.message_types_by_name['GetManifestRequest']
+_GETMANIFESTRESPONSE = DESCRIPTOR.message_types_by_name['GetManifestResponse']
+_LEGACYGETARTIFACTREQUEST = DESCRIPTOR.message_types_by_name['LegacyGetArtifactRequest']
+_ARTIFACTCHUNK = DESCRIPTOR.message_types_by_name['ArtifactChunk']
+_PUTARTIFACTMETADATA = DESCRIPTOR.message_types_by_name['PutArtifactMetadata']
+_PUTARTIFACTREQUEST = DESCRIPTOR.message_types_by_name['PutArtifactRequest']
+_PUTARTIFACTRESPONSE = DESCRIPTOR.message_types_by_name['PutArtifactResponse']
+_COMMITMANIFESTREQUEST = DESCRIPTOR.message_types_by_name['CommitManifestRequest']
+_COMMITMANIFESTRESPONSE = DESCRIPTOR.message_types_by_name['CommitManifestResponse']
+_COMMITMANIFESTRESPONSE_CONSTANTS = _COMMITMANIFESTRESPONSE.enum_types_by_name['Constants']
+ResolveArtifactsRequest = _reflection.GeneratedProtocolMessageType('ResolveArtifactsRequest', (_message.Message,), {
+  'DESCRIPTOR' : _RESOLVEARTIFACTSREQUEST,
+  '__module__' : 'beam_artifact_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.job_management.v1.ResolveArtifactsRequest)
+  })
+_sym_db.RegisterMessage(ResolveArtifactsRequest)
+
+ResolveArtifactsResponse = _reflection.GeneratedProtocolMessageType('ResolveArtifactsResponse', (_message.Message,), {
+  'DESCRIPTOR' : _RESOLVEARTIFACTSRESPONSE,
+  '__module__' : 'beam_artifact_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.job_management.v1.ResolveArtifactsResponse)
+  })
+_sym_db.RegisterMessage(ResolveArtifactsResponse)
+
+GetArtifactRequest = _reflection.GeneratedProtocolMessageType('GetArtifactRequest', (_message.Message,), {
+  'DESCRIPTOR' : _GETARTIFACTREQUEST,
+  '__module__' : 'beam_artifact_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.job_management.v1.GetArtifactRequest)
+  })
+_sym_db.RegisterMessage(GetArtifactRequest)
+
+GetArtifactResponse = _reflection.GeneratedProtocolMessageType('GetArtifactResponse', (_message.Message,), {
+  'DESCRIPTOR' : _GETARTIFACTRESPONSE,
+  '__module__' : 'beam_artifact_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.job_management.v1.GetArtifactResponse)
+  })
+_sym_db.RegisterMessage(GetArtifactResponse)
+
+ArtifactRequestWrapper = _reflection.GeneratedProtocolMessageType('ArtifactRequestWrapper', (_message.Message,), {
+  'DESCRIPTOR' : _ARTIFACTREQUESTWRAPPER,
+  '__module__' : 'beam_artifact_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.job_management.v1.ArtifactRequestWrapper)
+  })
+_sym_db.RegisterMessage(ArtifactRequestWrapper)
+
+ArtifactResponseWrapper = _reflection.GeneratedProtocolMessageType('ArtifactResponseWrapper', (_message.Message,), {
+  'DESCRIPTOR' : _ARTIFACTRESPONSEWRAPPER,
+  '__module__' : 'beam_artifact_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.job_management.v1.ArtifactResponseWrapper)
+  })
+_sym_db.RegisterMessage(ArtifactResponseWrapper)
+
+ArtifactMetadata = _reflection.GeneratedProtocolMessageType('ArtifactMetadata', (_message.Message,), {
+  'DESCRIPTOR' : _ARTIFACTMETADATA,
+  '__module__' : 'beam_artifact_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.job_management.v1.ArtifactMetadata)
+  })
+_sym_db.RegisterMessage(ArtifactMetadata)
+
+Manifest = _reflection.GeneratedProtocolMessageType('Manifest', (_message.Message,), {
+  'DESCRIPTOR' : _MANIFEST,
+  '__module__' : 'beam_artifact_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.job_management.v1.Manifest)
+  })
+_sym_db.RegisterMessage(Manifest)
+
+ProxyManifest = _reflection.GeneratedProtocolMessageType('ProxyManifest', (_message.Message,), {
+
+  'Location' : _reflection.GeneratedProtocolMessageType('Location', (_message.Message,), {
+    'DESCRIPTOR' : _PROXYMANIFEST_LOCATION,
+    '__module__' : 'beam_artifact_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.job_management.v1.ProxyManifest.Location)
+    })
+  ,
+  'DESCRIPTOR' : _PROXYMANIFEST,
+  '__module__' : 'beam_artifact_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.job_management.v1.ProxyManifest)
+  })
+_sym_db.RegisterMessage(ProxyManifest)
+_sym_db.RegisterMessage(ProxyManifest.Location)
+
+GetManifestRequest = _reflection.GeneratedProtocolMessageType('GetManifestRequest', (_message.Message,), {
+  'DESCRIPTOR' : _GETMANIFESTREQUEST,
+  '__module__' : 'beam_artifact_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.job_management.v1.GetManifestRequest)
+  })
+_sym_db.RegisterMessage(GetManifestRequest)
+
+GetManifestResponse = _reflection.GeneratedProtocolMessageType('GetManifestResponse', (_message.Message,), {
+  'DESCRIPTOR' : _GETMANIFESTRESPONSE,
+  '__module__' : 'beam_artifact_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.job_management.v1.GetManifestResponse)
+  })
+_sym_db.RegisterMessage(GetManifestResponse)
+
+LegacyGetArtifactRequest = _reflection.GeneratedProtocolMessageType('LegacyGetArtifactRequest', (_message.Message,), {
+  'DESCRIPTOR' : _LEGACYGETARTIFACTREQUEST,
+  '__module__' : 'beam_artifact_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.job_management.v1.LegacyGetArtifactRequest)
+  })
+_sym_db.RegisterMessage(LegacyGetArtifactRequest)
+
+ArtifactChunk = _reflection.GeneratedProtocolMessageType('ArtifactChunk', (_message.Message,), {
+  'DESCRIPTOR' : _ARTIFACTCHUNK,
+  '__module__' : 'beam_artifact_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.job_management.v1.ArtifactChunk)
+  })
+_sym_db.RegisterMessage(ArtifactChunk)
+
+PutArtifactMetadata = _reflection.GeneratedProtocolMessageType('PutArtifactMetadata', (_message.Message,), {
+  'DESCRIPTOR' : _PUTARTIFACTMETADATA,
+  '__module__' : 'beam_artifact_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.job_management.v1.PutArtifactMetadata)
+  })
+_sym_db.RegisterMessage(PutArtifactMetadata)
+
+PutArtifactRequest = _reflection.GeneratedProtocolMessageType('PutArtifactRequest', (_message.Message,), {
+  'DESCRIPTOR' : _PUTARTIFACTREQUEST,
+  '__module__' : 'beam_artifact_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.job_management.v1.PutArtifactRequest)
+  })
+_sym_db.RegisterMessage(PutArtifactRequest)
+
+PutArtifactResponse = _reflection.GeneratedProtocolMessageType('PutArtifactResponse', (_message.Message,), {
+  'DESCRIPTOR' : _PUTARTIFACTRESPONSE,
+  '__module__' : 'beam_artifact_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.job_management.v1.PutArtifactResponse)
+  })
+_sym_db.RegisterMessage(PutArtifactResponse)
+
+CommitManifestRequest = _reflection.GeneratedProtocolMessageType('CommitManifestRequest', (_message.Message,), {
+  'DESCRIPTOR' : _COMMITMANIFESTREQUEST,
+  '__module__' : 'beam_artifact_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.job_management.v1.CommitManifestRequest)
+  })
+_sym_db.RegisterMessage(CommitManifestRequest)
+
+CommitManifestResponse = _reflection.GeneratedProtocolMessageType('CommitManifestResponse', (_message.Message,), {
+  'DESCRIPTOR' : _COMMITMANIFESTRESPONSE,
+  '__module__' : 'beam_artifact_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.job_management.v1.CommitManifestResponse)
+  })
+_sym_db.RegisterMessage(CommitManifestResponse)
+
+_ARTIFACTRETRIEVALSERVICE = DESCRIPTOR.services_by_name['ArtifactRetrievalService']
+_ARTIFACTSTAGINGSERVICE = DESCRIPTOR.services_by_name['ArtifactStagingService']
+_LEGACYARTIFACTSTAGINGSERVICE = DESCRIPTOR.services_by_name['LegacyArtifactStagingService']
+_LEGACYARTIFACTRETRIEVALSERVICE = DESCRIPTOR.services_by_name['LegacyArtifactRetrievalService']
+if _descriptor._USE_C_DESCRIPTORS == False:
+
+  DESCRIPTOR._options = None
+  DESCRIPTOR._serialized_options = b'\n&org.apache.beam.model.jobmanagement.v1B\013ArtifactApiZOgithub.com/apache/beam/sdks/go/pkg/beam/model/jobmanagement_v1;jobmanagement_v1'
+  _COMMITMANIFESTRESPONSE_CONSTANTS.values_by_name["NO_ARTIFACTS_STAGED_TOKEN"]._options = None
+  _COMMITMANIFESTRESPONSE_CONSTANTS.values_by_name["NO_ARTIFACTS_STAGED_TOKEN"]._serialized_options = b'\252\264\372\302\005\027__no_artifacts_staged__'
+  _RESOLVEARTIFACTSREQUEST._serialized_start=91
+  _RESOLVEARTIFACTSREQUEST._serialized_end=215
+  _RESOLVEARTIFACTSRESPONSE._serialized_start=217
+  _RESOLVEARTIFACTSRESPONSE._serialized_end=321
+  _GETARTIFACTREQUEST._serialized_start=323
+  _GETARTIFACTREQUEST._serialized_end=417
+  _GETARTIFACTRESPONSE._serialized_start=419
+  _GETARTIFACTRESPONSE._serialized_end=454
+  _ARTIFACTREQUESTWRAPPER._serialized_start=457
+  _ARTIFACTREQUESTWRAPPER._serialized_end=673
+  _ARTIFACTRESPONSEWRAPPER._serialized_start=676
+  _ARTIFACTRESPONSEWRAPPER._serialized_end=954
+  _ARTIFACTMETADATA._serialized_start=956
+  _ARTIFACTMETADATA._serialized_end=1025
+  _MANIFEST._serialized_start=1027
+  _MANIFEST._serialized_end=1114
+  _PROXYMANIFEST._serialized_start=1117
+  _PROXYMANIFEST._serialized_end=1323
+  _PROXYMANIFEST_LOCATION._serialized_start=1286
+  _PROXYMANIFEST_LOCATION._serialized_end=1323
+  _GETMANIFESTREQUEST._serialized_start=1325
+  _GETMANIFESTREQUEST._serialized_end=1370
+  _GETMANIFESTRESPONSE._serialized_start=1372
+  _GETMANIFESTRESPONSE._serialized_end=1462
+  _LEGACYGETARTIFACTREQUEST._serialized_start=1464
+  _LEGACYGETARTIFACTREQUEST._serialized_end=1529
+  _ARTIFACTCHUNK._serialized_start=1531
+  _ARTIFACTCHUNK._serialized_end=1560
+  _PUTARTIFACTMETADATA._serialized_start=1563
+  _PUTARTIFACTMETADATA._serialized_end=1692
+  _PUTARTIFACTREQUEST._serialized_start=1695
+  _PUTARTIFACTREQUEST._serialized_end=1880
+  _PUTARTIFACTRESPONSE._serialized_start=1882
+  _PUTARTIFACTRESPONSE._serialized_end=1903
+  _COMMITMANIFESTREQUEST._serialized_start=1905
+  _COMMITMANIFESTREQUEST._serialized_end=2028
+  _COMMITMANIFESTRESPONSE._serialized_start=2030
+  _COMMITMANIFESTRESPONSE._serialized_end=2154
+  _COMMITMANIFESTRESPONSE_CONSTANTS._serialized_start=2081
+  _COMMITMANIFESTRESPONSE_CONSTANTS._serialized_end=2154
+  _ARTIFACTRETRIEVALSERVICE._serialized_start=2157
+  _ARTIFACTRETRIEVALSERVICE._serialized_end=2478
+  _ARTIFACTSTAGINGSERVICE._serialized_start=2481
+  _ARTIFACTSTAGINGSERVICE._serialized_end=2676
+  _LEGACYARTIFACTSTAGINGSERVICE._serialized_start=2679
+  _LEGACYARTIFACTSTAGINGSERVICE._serialized_end=2998
+  _LEGACYARTIFACTRETRIEVALSERVICE._serialized_start=3001
+  _LEGACYARTIFACTRETRIEVALSERVICE._serialized_end=3313
+# @@protoc_insertion_point(module_scope)
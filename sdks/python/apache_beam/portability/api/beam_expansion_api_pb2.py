@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: beam_expansion_api.proto
+"""Generated protocol buffer code."""
+from __future__ import absolute_import
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import message as _message
+from google.protobuf import reflection as _reflection
+from google.protobuf import symbol_database as _symbol_database
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from . import beam_runner_api_pb2 as beam__runner__api__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x18\x62\x65\x61m_expansion_api.proto\x12\"org.apache.beam.model.expansion.v1\x1a\x15\x62\x65\x61m_runner_api.proto\"\xaa\x01\n\x10\x45xpansionRequest\x12\x41\n\ncomponents\x18\x01 \x01(\x0b\x32-.org.apache.beam.model.pipeline.v1.Components\x12@\n\ttransform\x18\x02 \x01(\x0b\x32-.org.apache.beam.model.pipeline.v1.PTransform\x12\x11\n\tnamespace\x18\x03 \x01(\t\"\xbd\x01\n\x11\x45xpansionResponse\x12\x41\n\ncomponents\x18\x01 \x01(\x0b\x32-.org.apache.beam.model.pipeline.v1.Components\x12@\n\ttransform\x18\x02 \x01(\x0b\x32-.org.apache.beam.model.pipeline.v1.PTransform\x12\x14\n\x0crequirements\x18\x03 \x03(\t\x12\r\n\x05\x65rror\x18\n \x01(\t2\x89\x01\n\x10\x45xpansionService\x12u\n\x06\x45xpand\x12\x34.org.apache.beam.model.expansion.v1.ExpansionRequest\x1a\x35.org.apache.beam.model.expansion.v1.ExpansionResponseB\x83\x01\n\"org.apache.beam.model.expansion.v1B\x0c\x45xpansionApiZOgithub.com/apache/beam/sdks/go/pkg/beam/model/jobmanagement_v1;jobmanagement_v1b\x06proto3')
+
+
+
+_EXPANSIONREQUEST = DESCRIPTOR.message_types_by_name['ExpansionRequest']
+_EXPANSIONRESPONSE = DESCRIPTOR.message_types_by_name['ExpansionResponse']
+ExpansionRequest = _reflection.GeneratedProtocolMessageType('ExpansionRequest', (_message.Message,), {
+  'DESCRIPTOR' : _EXPANSIONREQUEST,
+  '__module__' : 'beam_expansion_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.expansion.v1.ExpansionRequest)
+  })
+_sym_db.RegisterMessage(ExpansionRequest)
+
+ExpansionResponse = _reflection.GeneratedProtocolMessageType('ExpansionResponse', (_message.Message,), {
+  'DESCRIPTOR' : _EXPANSIONRESPONSE,
+  '__module__' : 'beam_expansion_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.expansion.v1.ExpansionResponse)
+  })
+_sym_db.RegisterMessage(ExpansionResponse)
+
+_EXPANSIONSERVICE = DESCRIPTOR.services_by_name['ExpansionService']
+if _descriptor._USE_C_DESCRIPTORS == False:
+
+  DESCRIPTOR._options = None
+  DESCRIPTOR._serialized_options = b'\n\"org.apache.beam.model.expansion.v1B\014ExpansionApiZOgithub.com/apache/beam/sdks/go/pkg/beam/model/jobmanagement_v1;jobmanagement_v1'
+  _EXPANSIONREQUEST._serialized_start=88
+  _EXPANSIONREQUEST._serialized_end=258
+  _EXPANSIONRESPONSE._serialized_start=261
+  _EXPANSIONRESPONSE._serialized_end=450
+  _EXPANSIONSERVICE._serialized_start=453
+  _EXPANSIONSERVICE._serialized_end=590
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,753 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: beam_fn_api.proto
+"""Generated protocol buffer code."""
+from __future__ import absolute_import
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import message as _message
+from google.protobuf import reflection as _reflection
+from google.protobuf import symbol_database as _symbol_database
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from . import beam_runner_api_pb2 as beam__runner__api__pb2
+from . import endpoints_pb2 as endpoints__pb2
+from google.protobuf import descriptor_pb2 as google_dot_protobuf_dot_descriptor__pb2
+from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
+from google.protobuf import duration_pb2 as google_dot_protobuf_dot_duration__pb2
+from . import metrics_pb2 as metrics__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x11\x62\x65\x61m_fn_api.proto\x12%org.apache.beam.model.fn_execution.v1\x1a\x15\x62\x65\x61m_runner_api.proto\x1a\x0f\x65ndpoints.proto\x1a google/protobuf/descriptor.proto\x1a\x1fgoogle/protobuf/timestamp.proto\x1a\x1egoogle/protobuf/duration.proto\x1a\rmetrics.proto\"{\n\x0eRemoteGrpcPort\x12W\n\x16\x61pi_service_descriptor\x18\x01 \x01(\x0b\x32\x37.org.apache.beam.model.pipeline.v1.ApiServiceDescriptor\x12\x10\n\x08\x63oder_id\x18\x02 \x01(\t\"I\n!GetProcessBundleDescriptorRequest\x12$\n\x1cprocess_bundle_descriptor_id\x18\x01 \x01(\t\"\xd1\x05\n\x12InstructionRequest\x12\x16\n\x0einstruction_id\x18\x01 \x01(\t\x12V\n\x0eprocess_bundle\x18\xe9\x07 \x01(\x0b\x32;.org.apache.beam.model.fn_execution.v1.ProcessBundleRequestH\x00\x12g\n\x17process_bundle_progress\x18\xea\x07 \x01(\x0b\x32\x43.org.apache.beam.model.fn_execution.v1.ProcessBundleProgressRequestH\x00\x12\x61\n\x14process_bundle_split\x18\xeb\x07 \x01(\x0b\x32@.org.apache.beam.model.fn_execution.v1.ProcessBundleSplitRequestH\x00\x12X\n\x0f\x66inalize_bundle\x18\xec\x07 \x01(\x0b\x32<.org.apache.beam.model.fn_execution.v1.FinalizeBundleRequestH\x00\x12\x62\n\x10monitoring_infos\x18\xed\x07 \x01(\x0b\x32\x45.org.apache.beam.model.fn_execution.v1.MonitoringInfosMetadataRequestH\x00\x12i\n\x18harness_monitoring_infos\x18\xee\x07 \x01(\x0b\x32\x44.org.apache.beam.model.fn_execution.v1.HarnessMonitoringInfosRequestH\x00\x12K\n\x08register\x18\xe8\x07 \x01(\x0b\x32\x36.org.apache.beam.model.fn_execution.v1.RegisterRequestH\x00\x42\t\n\x07request\"\xe9\x05\n\x13InstructionResponse\x12\x16\n\x0einstruction_id\x18\x01 \x01(\t\x12\r\n\x05\x65rror\x18\x02 \x01(\t\x12W\n\x0eprocess_bundle\x18\xe9\x07 \x01(\x0b\x32<.org.apache.beam.model.fn_execution.v1.ProcessBundleResponseH\x00\x12h\n\x17process_bundle_progress\x18\xea\x07 \x01(\x0b\x32\x44.org.apache.beam.model.fn_execution.v1.ProcessBundleProgressResponseH\x00\x12\x62\n\x14process_bundle_split\x18\xeb\x07 \x01(\x0b\x32\x41.org.apache.beam.model.fn_execution.v1.ProcessBundleSplitResponseH\x00\x12Y\n\x0f\x66inalize_bundle\x18\xec\x07 \x01(\x0b\x32=.org.apache.beam.model.fn_execution.v1.FinalizeBundleResponseH\x00\x12\x63\n\x10monitoring_infos\x18\xed\x07 \x01(\x0b\x32\x46.org.apache.beam.model.fn_execution.v1.MonitoringInfosMetadataResponseH\x00\x12j\n\x18harness_monitoring_infos\x18\xee\x07 \x01(\x0b\x32\x45.org.apache.beam.model.fn_execution.v1.HarnessMonitoringInfosResponseH\x00\x12L\n\x08register\x18\xe8\x07 \x01(\x0b\x32\x37.org.apache.beam.model.fn_execution.v1.RegisterResponseH\x00\x42\n\n\x08response\"\x1f\n\x1dHarnessMonitoringInfosRequest\"\xcb\x01\n\x1eHarnessMonitoringInfosResponse\x12r\n\x0fmonitoring_data\x18\x01 \x03(\x0b\x32Y.org.apache.beam.model.fn_execution.v1.HarnessMonitoringInfosResponse.MonitoringDataEntry\x1a\x35\n\x13MonitoringDataEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x0c:\x02\x38\x01\"t\n\x0fRegisterRequest\x12\x61\n\x19process_bundle_descriptor\x18\x01 \x03(\x0b\x32>.org.apache.beam.model.fn_execution.v1.ProcessBundleDescriptor\"\x12\n\x10RegisterResponse\"\xe1\t\n\x17ProcessBundleDescriptor\x12\n\n\x02id\x18\x01 \x01(\t\x12\x62\n\ntransforms\x18\x02 \x03(\x0b\x32N.org.apache.beam.model.fn_execution.v1.ProcessBundleDescriptor.TransformsEntry\x12\x66\n\x0cpcollections\x18\x03 \x03(\x0b\x32P.org.apache.beam.model.fn_execution.v1.ProcessBundleDescriptor.PcollectionsEntry\x12u\n\x14windowing_strategies\x18\x04 \x03(\x0b\x32W.org.apache.beam.model.fn_execution.v1.ProcessBundleDescriptor.WindowingStrategiesEntry\x12Z\n\x06\x63oders\x18\x05 \x03(\x0b\x32J.org.apache.beam.model.fn_execution.v1.ProcessBundleDescriptor.CodersEntry\x12\x66\n\x0c\x65nvironments\x18\x06 \x03(\x0b\x32P.org.apache.beam.model.fn_execution.v1.ProcessBundleDescriptor.EnvironmentsEntry\x12]\n\x1cstate_api_service_descriptor\x18\x07 \x01(\x0b\x32\x37.org.apache.beam.model.pipeline.v1.ApiServiceDescriptor\x12]\n\x1ctimer_api_service_descriptor\x18\x08 \x01(\x0b\x32\x37.org.apache.beam.model.pipeline.v1.ApiServiceDescriptor\x1a`\n\x0fTransformsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12<\n\x05value\x18\x02 \x01(\x0b\x32-.org.apache.beam.model.pipeline.v1.PTransform:\x02\x38\x01\x1a\x63\n\x11PcollectionsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12=\n\x05value\x18\x02 \x01(\x0b\x32..org.apache.beam.model.pipeline.v1.PCollection:\x02\x38\x01\x1ap\n\x18WindowingStrategiesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\x43\n\x05value\x18\x02 \x01(\x0b\x32\x34.org.apache.beam.model.pipeline.v1.WindowingStrategy:\x02\x38\x01\x1aW\n\x0b\x43odersEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\x37\n\x05value\x18\x02 \x01(\x0b\x32(.org.apache.beam.model.pipeline.v1.Coder:\x02\x38\x01\x1a\x63\n\x11\x45nvironmentsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12=\n\x05value\x18\x02 \x01(\x0b\x32..org.apache.beam.model.pipeline.v1.Environment:\x02\x38\x01\"\xd3\x02\n\x11\x42undleApplication\x12\x14\n\x0ctransform_id\x18\x01 \x01(\t\x12\x10\n\x08input_id\x18\x02 \x01(\t\x12\x0f\n\x07\x65lement\x18\x03 \x01(\x0c\x12i\n\x11output_watermarks\x18\x04 \x03(\x0b\x32N.org.apache.beam.model.fn_execution.v1.BundleApplication.OutputWatermarksEntry\x12\x45\n\nis_bounded\x18\x05 \x01(\x0e\x32\x31.org.apache.beam.model.pipeline.v1.IsBounded.Enum\x1aS\n\x15OutputWatermarksEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12)\n\x05value\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.Timestamp:\x02\x38\x01\"\xa2\x01\n\x18\x44\x65layedBundleApplication\x12M\n\x0b\x61pplication\x18\x01 \x01(\x0b\x32\x38.org.apache.beam.model.fn_execution.v1.BundleApplication\x12\x37\n\x14requested_time_delay\x18\x02 \x01(\x0b\x32\x19.google.protobuf.Duration\"\xd7\x03\n\x14ProcessBundleRequest\x12$\n\x1cprocess_bundle_descriptor_id\x18\x01 \x01(\t\x12\\\n\x0c\x63\x61\x63he_tokens\x18\x02 \x03(\x0b\x32\x46.org.apache.beam.model.fn_execution.v1.ProcessBundleRequest.CacheToken\x1a\xba\x02\n\nCacheToken\x12\x66\n\nuser_state\x18\x01 \x01(\x0b\x32P.org.apache.beam.model.fn_execution.v1.ProcessBundleRequest.CacheToken.UserStateH\x00\x12\x66\n\nside_input\x18\x02 \x01(\x0b\x32P.org.apache.beam.model.fn_execution.v1.ProcessBundleRequest.CacheToken.SideInputH\x00\x12\r\n\x05token\x18\n \x01(\x0c\x1a\x0b\n\tUserState\x1a\x38\n\tSideInput\x12\x14\n\x0ctransform_id\x18\x01 \x01(\t\x12\x15\n\rside_input_id\x18\x02 \x01(\tB\x06\n\x04type\"\x84\x03\n\x15ProcessBundleResponse\x12W\n\x0eresidual_roots\x18\x02 \x03(\x0b\x32?.org.apache.beam.model.fn_execution.v1.DelayedBundleApplication\x12K\n\x10monitoring_infos\x18\x03 \x03(\x0b\x32\x31.org.apache.beam.model.pipeline.v1.MonitoringInfo\x12\x1d\n\x15requires_finalization\x18\x04 \x01(\x08\x12i\n\x0fmonitoring_data\x18\x05 \x03(\x0b\x32P.org.apache.beam.model.fn_execution.v1.ProcessBundleResponse.MonitoringDataEntry\x1a\x35\n\x13MonitoringDataEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x0c:\x02\x38\x01J\x04\x08\x01\x10\x02\"6\n\x1cProcessBundleProgressRequest\x12\x16\n\x0einstruction_id\x18\x01 \x01(\t\"<\n\x1eMonitoringInfosMetadataRequest\x12\x1a\n\x12monitoring_info_id\x18\x01 \x03(\t\"\xa8\x02\n\x1dProcessBundleProgressResponse\x12K\n\x10monitoring_infos\x18\x03 \x03(\x0b\x32\x31.org.apache.beam.model.pipeline.v1.MonitoringInfo\x12q\n\x0fmonitoring_data\x18\x05 \x03(\x0b\x32X.org.apache.beam.model.fn_execution.v1.ProcessBundleProgressResponse.MonitoringDataEntry\x1a\x35\n\x13MonitoringDataEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x0c:\x02\x38\x01J\x04\x08\x01\x10\x02J\x04\x08\x02\x10\x03J\x04\x08\x04\x10\x05\"\x80\x02\n\x1fMonitoringInfosMetadataResponse\x12s\n\x0fmonitoring_info\x18\x01 \x03(\x0b\x32Z.org.apache.beam.model.fn_execution.v1.MonitoringInfosMetadataResponse.MonitoringInfoEntry\x1ah\n\x13MonitoringInfoEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12@\n\x05value\x18\x02 \x01(\x0b\x32\x31.org.apache.beam.model.pipeline.v1.MonitoringInfo:\x02\x38\x01\"\x95\x03\n\x19ProcessBundleSplitRequest\x12\x16\n\x0einstruction_id\x18\x01 \x01(\t\x12k\n\x0e\x64\x65sired_splits\x18\x03 \x03(\x0b\x32S.org.apache.beam.model.fn_execution.v1.ProcessBundleSplitRequest.DesiredSplitsEntry\x1am\n\x0c\x44\x65siredSplit\x12\x1d\n\x15\x66raction_of_remainder\x18\x01 \x01(\x01\x12\x1c\n\x14\x61llowed_split_points\x18\x03 \x03(\x03\x12 \n\x18\x65stimated_input_elements\x18\x02 \x01(\x03\x1a\x83\x01\n\x12\x44\x65siredSplitsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\\\n\x05value\x18\x02 \x01(\x0b\x32M.org.apache.beam.model.fn_execution.v1.ProcessBundleSplitRequest.DesiredSplit:\x02\x38\x01\"\x92\x03\n\x1aProcessBundleSplitResponse\x12O\n\rprimary_roots\x18\x01 \x03(\x0b\x32\x38.org.apache.beam.model.fn_execution.v1.BundleApplication\x12W\n\x0eresidual_roots\x18\x02 \x03(\x0b\x32?.org.apache.beam.model.fn_execution.v1.DelayedBundleApplication\x12\x66\n\x0e\x63hannel_splits\x18\x03 \x03(\x0b\x32N.org.apache.beam.model.fn_execution.v1.ProcessBundleSplitResponse.ChannelSplit\x1a\x62\n\x0c\x43hannelSplit\x12\x14\n\x0ctransform_id\x18\x01 \x01(\t\x12\x1c\n\x14last_primary_element\x18\x02 \x01(\x03\x12\x1e\n\x16\x66irst_residual_element\x18\x03 \x01(\x03\"/\n\x15\x46inalizeBundleRequest\x12\x16\n\x0einstruction_id\x18\x01 \x01(\t\"\x18\n\x16\x46inalizeBundleResponse\"\xdd\x02\n\x08\x45lements\x12\x42\n\x04\x64\x61ta\x18\x01 \x03(\x0b\x32\x34.org.apache.beam.model.fn_execution.v1.Elements.Data\x12\x46\n\x06timers\x18\x02 \x03(\x0b\x32\x36.org.apache.beam.model.fn_execution.v1.Elements.Timers\x1aS\n\x04\x44\x61ta\x12\x16\n\x0einstruction_id\x18\x01 \x01(\t\x12\x14\n\x0ctransform_id\x18\x02 \x01(\t\x12\x0c\n\x04\x64\x61ta\x18\x03 \x01(\x0c\x12\x0f\n\x07is_last\x18\x04 \x01(\x08\x1ap\n\x06Timers\x12\x16\n\x0einstruction_id\x18\x01 \x01(\t\x12\x14\n\x0ctransform_id\x18\x02 \x01(\t\x12\x17\n\x0ftimer_family_id\x18\x03 \x01(\t\x12\x0e\n\x06timers\x18\x04 \x01(\x0c\x12\x0f\n\x07is_last\x18\x05 \x01(\x08\"\xe3\x02\n\x0cStateRequest\x12\n\n\x02id\x18\x01 \x01(\t\x12\x16\n\x0einstruction_id\x18\x02 \x01(\t\x12\x42\n\tstate_key\x18\x03 \x01(\x0b\x32/.org.apache.beam.model.fn_execution.v1.StateKey\x12\x46\n\x03get\x18\xe8\x07 \x01(\x0b\x32\x36.org.apache.beam.model.fn_execution.v1.StateGetRequestH\x00\x12L\n\x06\x61ppend\x18\xe9\x07 \x01(\x0b\x32\x39.org.apache.beam.model.fn_execution.v1.StateAppendRequestH\x00\x12J\n\x05\x63lear\x18\xea\x07 \x01(\x0b\x32\x38.org.apache.beam.model.fn_execution.v1.StateClearRequestH\x00\x42\t\n\x07request\"\x9b\x02\n\rStateResponse\x12\n\n\x02id\x18\x01 \x01(\t\x12\r\n\x05\x65rror\x18\x02 \x01(\t\x12G\n\x03get\x18\xe8\x07 \x01(\x0b\x32\x37.org.apache.beam.model.fn_execution.v1.StateGetResponseH\x00\x12M\n\x06\x61ppend\x18\xe9\x07 \x01(\x0b\x32:.org.apache.beam.model.fn_execution.v1.StateAppendResponseH\x00\x12K\n\x05\x63lear\x18\xea\x07 \x01(\x0b\x32\x39.org.apache.beam.model.fn_execution.v1.StateClearResponseH\x00\x42\n\n\x08response\"\xdb\x06\n\x08StateKey\x12H\n\x06runner\x18\x01 \x01(\x0b\x32\x36.org.apache.beam.model.fn_execution.v1.StateKey.RunnerH\x00\x12`\n\x13multimap_side_input\x18\x02 \x01(\x0b\x32\x41.org.apache.beam.model.fn_execution.v1.StateKey.MultimapSideInputH\x00\x12V\n\x0e\x62\x61g_user_state\x18\x03 \x01(\x0b\x32<.org.apache.beam.model.fn_execution.v1.StateKey.BagUserStateH\x00\x12`\n\x13iterable_side_input\x18\x04 \x01(\x0b\x32\x41.org.apache.beam.model.fn_execution.v1.StateKey.IterableSideInputH\x00\x12i\n\x18multimap_keys_side_input\x18\x05 \x01(\x0b\x32\x45.org.apache.beam.model.fn_execution.v1.StateKey.MultimapKeysSideInputH\x00\x1a\x15\n\x06Runner\x12\x0b\n\x03key\x18\x01 \x01(\x0c\x1aP\n\x11IterableSideInput\x12\x14\n\x0ctransform_id\x18\x01 \x01(\t\x12\x15\n\rside_input_id\x18\x02 \x01(\t\x12\x0e\n\x06window\x18\x03 \x01(\x0c\x1a]\n\x11MultimapSideInput\x12\x14\n\x0ctransform_id\x18\x01 \x01(\t\x12\x15\n\rside_input_id\x18\x02 \x01(\t\x12\x0e\n\x06window\x18\x03 \x01(\x0c\x12\x0b\n\x03key\x18\x04 \x01(\x0c\x1aT\n\x15MultimapKeysSideInput\x12\x14\n\x0ctransform_id\x18\x01 \x01(\t\x12\x15\n\rside_input_id\x18\x02 \x01(\t\x12\x0e\n\x06window\x18\x03 \x01(\x0c\x1aX\n\x0c\x42\x61gUserState\x12\x14\n\x0ctransform_id\x18\x01 \x01(\t\x12\x15\n\ruser_state_id\x18\x02 \x01(\t\x12\x0e\n\x06window\x18\x03 \x01(\x0c\x12\x0b\n\x03key\x18\x04 \x01(\x0c\x42\x06\n\x04type\"-\n\x0fStateGetRequest\x12\x1a\n\x12\x63ontinuation_token\x18\x01 \x01(\x0c\"<\n\x10StateGetResponse\x12\x1a\n\x12\x63ontinuation_token\x18\x01 \x01(\x0c\x12\x0c\n\x04\x64\x61ta\x18\x02 \x01(\x0c\"\"\n\x12StateAppendRequest\x12\x0c\n\x04\x64\x61ta\x18\x01 \x01(\x0c\"\x15\n\x13StateAppendResponse\"\x13\n\x11StateClearRequest\"\x14\n\x12StateClearResponse\"\xc0\x03\n\x08LogEntry\x12O\n\x08severity\x18\x01 \x01(\x0e\x32=.org.apache.beam.model.fn_execution.v1.LogEntry.Severity.Enum\x12-\n\ttimestamp\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x0f\n\x07message\x18\x03 \x01(\t\x12\r\n\x05trace\x18\x04 \x01(\t\x12\x16\n\x0einstruction_id\x18\x05 \x01(\t\x12\x14\n\x0ctransform_id\x18\x06 \x01(\t\x12\x14\n\x0clog_location\x18\x07 \x01(\t\x12\x0e\n\x06thread\x18\x08 \x01(\t\x1aL\n\x04List\x12\x44\n\x0blog_entries\x18\x01 \x03(\x0b\x32/.org.apache.beam.model.fn_execution.v1.LogEntry\x1ar\n\x08Severity\"f\n\x04\x45num\x12\x0f\n\x0bUNSPECIFIED\x10\x00\x12\t\n\x05TRACE\x10\x01\x12\t\n\x05\x44\x45\x42UG\x10\x02\x12\x08\n\x04INFO\x10\x03\x12\n\n\x06NOTICE\x10\x04\x12\x08\n\x04WARN\x10\x05\x12\t\n\x05\x45RROR\x10\x06\x12\x0c\n\x08\x43RITICAL\x10\x07\"\x0c\n\nLogControl\"\xfc\x03\n\x12StartWorkerRequest\x12\x11\n\tworker_id\x18\x01 \x01(\t\x12Q\n\x10\x63ontrol_endpoint\x18\x02 \x01(\x0b\x32\x37.org.apache.beam.model.pipeline.v1.ApiServiceDescriptor\x12Q\n\x10logging_endpoint\x18\x03 \x01(\x0b\x32\x37.org.apache.beam.model.pipeline.v1.ApiServiceDescriptor\x12R\n\x11\x61rtifact_endpoint\x18\x04 \x01(\x0b\x32\x37.org.apache.beam.model.pipeline.v1.ApiServiceDescriptor\x12S\n\x12provision_endpoint\x18\x05 \x01(\x0b\x32\x37.org.apache.beam.model.pipeline.v1.ApiServiceDescriptor\x12U\n\x06params\x18\n \x03(\x0b\x32\x45.org.apache.beam.model.fn_execution.v1.StartWorkerRequest.ParamsEntry\x1a-\n\x0bParamsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"$\n\x13StartWorkerResponse\x12\r\n\x05\x65rror\x18\x01 \x01(\t\"&\n\x11StopWorkerRequest\x12\x11\n\tworker_id\x18\x01 \x01(\t\"#\n\x12StopWorkerResponse\x12\r\n\x05\x65rror\x18\x01 \x01(\t\"!\n\x13WorkerStatusRequest\x12\n\n\x02id\x18\x01 \x01(\t\"F\n\x14WorkerStatusResponse\x12\n\n\x02id\x18\x01 \x01(\t\x12\r\n\x05\x65rror\x18\x02 \x01(\t\x12\x13\n\x0bstatus_info\x18\x03 \x01(\t2\xc3\x02\n\rBeamFnControl\x12\x86\x01\n\x07\x43ontrol\x12:.org.apache.beam.model.fn_execution.v1.InstructionResponse\x1a\x39.org.apache.beam.model.fn_execution.v1.InstructionRequest\"\x00(\x01\x30\x01\x12\xa8\x01\n\x1aGetProcessBundleDescriptor\x12H.org.apache.beam.model.fn_execution.v1.GetProcessBundleDescriptorRequest\x1a>.org.apache.beam.model.fn_execution.v1.ProcessBundleDescriptor\"\x00\x32|\n\nBeamFnData\x12n\n\x04\x44\x61ta\x12/.org.apache.beam.model.fn_execution.v1.Elements\x1a/.org.apache.beam.model.fn_execution.v1.Elements\"\x00(\x01\x30\x01\x32\x87\x01\n\x0b\x42\x65\x61mFnState\x12x\n\x05State\x12\x33.org.apache.beam.model.fn_execution.v1.StateRequest\x1a\x34.org.apache.beam.model.fn_execution.v1.StateResponse\"\x00(\x01\x30\x01\x32\x89\x01\n\rBeamFnLogging\x12x\n\x07Logging\x12\x34.org.apache.beam.model.fn_execution.v1.LogEntry.List\x1a\x31.org.apache.beam.model.fn_execution.v1.LogControl\"\x00(\x01\x30\x01\x32\xa9\x02\n\x18\x42\x65\x61mFnExternalWorkerPool\x12\x86\x01\n\x0bStartWorker\x12\x39.org.apache.beam.model.fn_execution.v1.StartWorkerRequest\x1a:.org.apache.beam.model.fn_execution.v1.StartWorkerResponse\"\x00\x12\x83\x01\n\nStopWorker\x12\x38.org.apache.beam.model.fn_execution.v1.StopWorkerRequest\x1a\x39.org.apache.beam.model.fn_execution.v1.StopWorkerResponse\"\x00\x32\xa4\x01\n\x12\x42\x65\x61mFnWorkerStatus\x12\x8d\x01\n\x0cWorkerStatus\x12;.org.apache.beam.model.fn_execution.v1.WorkerStatusResponse\x1a:.org.apache.beam.model.fn_execution.v1.WorkerStatusRequest\"\x00(\x01\x30\x01\x42~\n$org.apache.beam.model.fnexecution.v1B\tBeamFnApiZKgithub.com/apache/beam/sdks/go/pkg/beam/model/fnexecution_v1;fnexecution_v1b\x06proto3')
+
+
+
+_REMOTEGRPCPORT = DESCRIPTOR.message_types_by_name['RemoteGrpcPort']
+_GETPROCESSBUNDLEDESCRIPTORREQUEST = DESCRIPTOR.message_types_by_name['GetProcessBundleDescriptorRequest']
+_INSTRUCTIONREQUEST = DESCRIPTOR.message_types_by_name['InstructionRequest']
+_INSTRUCTIONRESPONSE = DESCRIPTOR.message_types_by_name['InstructionResponse']
+_HARNESSMONITORINGINFOSREQUEST = DESCRIPTOR.message_types_by_name['HarnessMonitoringInfosRequest']
+_HARNESSMONITORINGINFOSRESPONSE = DESCRIPTOR.message_types_by_name['HarnessMonitoringInfosResponse']
+_HARNESSMONITORINGINFOSRESPONSE_MONITORINGDATAENTRY = _HARNESSMONITORINGINFOSRESPONSE.nested_types_by_name['MonitoringDataEntry']
+_REGISTERREQUEST = DESCRIPTOR.message_types_by_name['RegisterRequest']
+_REGISTERRESPONSE = DESCRIPTOR.message_types_by_name['RegisterResponse']
+_PROCESSBUNDLEDESCRIPTOR = DESCRIPTOR.message_types_by_name['ProcessBundleDescriptor']
+_PROCESSBUNDLEDESCRIPTOR_TRANSFORMSENTRY = _PROCESSBUNDLEDESCRIPTOR.nested_types_by_name['TransformsEntry']
+_PROCESSBUNDLEDESCRIPTOR_PCOLLECTIONSENTRY = _PROCESSBUNDLEDESCRIPTOR.nested_types_by_name['PcollectionsEntry']
+_PROCESSBUNDLEDESCRIPTOR_WINDOWINGSTRATEGIESENTRY = _PROCESSBUNDLEDESCRIPTOR.nested_types_by_name['WindowingStrategiesEntry']
+_PROCESSBUNDLEDESCRIPTOR_CODERSENTRY = _PROCESSBUNDLEDESCRIPTOR.nested_types_by_name['CodersEntry']
+_PROCESSBUNDLEDESCRIPTOR_ENVIRONMENTSENTRY = _PROCESSBUNDLEDESCRIPTOR.nested_types_by_name['EnvironmentsEntry']
+_BUNDLEAPPLICATION = DESCRIPTOR.message_types_by_name['BundleApplication']
+_BUNDLEAPPLICATION_OUTPUTWATERMARKSENTRY = _BUNDLEAPPLICATION.nested_types_by_name['OutputWatermarksEntry']
+_DELAYEDBUNDLEAPPLICATION = DESCRIPTOR.message_types_by_name['DelayedBundleApplication']
+_PROCESSBUNDLEREQUEST = DESCRIPTOR.message_types_by_name['ProcessBundleRequest']
+_PROCESSBUNDLEREQUEST_CACHETOKEN = _PROCESSBUNDLEREQUEST.nested_types_by_name['CacheToken']
+_PROCESSBUNDLEREQUEST_CACHETOKEN_USERSTATE = _PROCESSBUNDLEREQUEST_CACHETOKEN.nested_types_by_name['UserState']
+_PROCESSBUNDLEREQUEST_CACHETOKEN_SIDEINPUT = _PROCESSBUNDLEREQUEST_CACHETOKEN.nested_types_by_name['SideInput']
+_PROCESSBUNDLERESPONSE = DESCRIPTOR.message_types_by_name['ProcessBundleResponse']
+_PROCESSBUNDLERESPONSE_MONITORINGDATAENTRY = _PROCESSBUNDLERESPONSE.nested_types_by_name['MonitoringDataEntry']
+_PROCESSBUNDLEPROGRESSREQUEST = DESCRIPTOR.message_types_by_name['ProcessBundleProgressRequest']
+_MONITORINGINFOSMETADATAREQUEST = DESCRIPTOR.message_types_by_name['MonitoringInfosMetadataRequest']
+_PROCESSBUNDLEPROGRESSRESPONSE = DESCRIPTOR.message_types_by_name['ProcessBundleProgressResponse']
+_PROCESSBUNDLEPROGRESSRESPONSE_MONITORINGDATAENTRY = _PROCESSBUNDLEPROGRESSRESPONSE.nested_types_by_name['MonitoringDataEntry']
+_MONITORINGINFOSMETADATARESPONSE = DESCRIPTOR.message_types_by_name['MonitoringInfosMetadataResponse']
+_MONITORINGINFOSMETADATARESPONSE_MONITORINGINFOENTRY = _MONITORINGINFOSMETADATARESPONSE.nested_types_by_name['MonitoringInfoEntry']
+_PROCESSBUNDLESPLITREQUEST = DESCRIPTOR.message_types_by_name['ProcessBundleSplitRequest']
+_PROCESSBUNDLESPLITREQUEST_DESIREDSPLIT = _PROCESSBUNDLESPLITREQUEST.nested_types_by_name['DesiredSplit']
+_PROCESSBUNDLESPLITREQUEST_DESIREDSPLITSENTRY = _PROCESSBUNDLESPLITREQUEST.nested_types_by_name['DesiredSplitsEntry']
+_PROCESSBUNDLESPLITRESPONSE = DESCRIPTOR.message_types_by_name['ProcessBundleSplitResponse']
+_PROCESSBUNDLESPLITRESPONSE_CHANNELSPLIT = _PROCESSBUNDLESPLITRESPONSE.nested_types_by_name['ChannelSplit']
+_FINALIZEBUNDLEREQUEST = DESCRIPTOR.message_types_by_name['FinalizeBundleRequest']
+_FINALIZEBUNDLERESPONSE = DESCRIPTOR.message_types_by_name['FinalizeBundleResponse']
+_ELEMENTS = DESCRIPTOR.message_types_by_name['Elements']
+_ELEMENTS_DATA = _ELEMENTS.nested_types_by_name['Data']
+_ELEMENTS_TIMERS = _ELEMENTS.nested_types_by_name['Timers']
+_STATEREQUEST = DESCRIPTOR.message_types_by_name['StateRequest']
+_STATERESPONSE = DESCRIPTOR.message_types_by_name['StateResponse']
+_STATEKEY = DESCRIPTOR.message_types_by_name['StateKey']
+_STATEKEY_RUNNER = _STATEKEY.nested_types_by_name['Runner']
+_STATEKEY_ITERABLESIDEINPUT = _STATEKEY.nested_types_by_name['IterableSideInput']
+_STATEKEY_MULTIMAPSIDEINPUT = _STATEKEY.nested_types_by_name['MultimapSideInput']
+_STATEKEY_MULTIMAPKEYSSIDEINPUT = _STATEKEY.nested_types_by_name['MultimapKeysSideInput']
+_STATEKEY_BAGUSERSTATE = _STATEKEY.nested_types_by_name['BagUserState']
+_STATEGETREQUEST = DESCRIPTOR.message_types_by_name['StateGetRequest']
+_STATEGETRESPONSE = DESCRIPTOR.message_types_by_name['StateGetResponse']
+_STATEAPPENDREQUEST = DESCRIPTOR.message_types_by_name['StateAppendRequest']
+_STATEAPPENDRESPONSE = DESCRIPTOR.message_types_by_name['StateAppendResponse']
+_STATECLEARREQUEST = DESCRIPTOR.message_types_by_name['StateClearRequest']
+_STATECLEARRESPONSE = DESCRIPTOR.message_types_by_name['StateClearResponse']
+_LOGENTRY = DESCRIPTOR.message_types_by_name['LogEntry']
+_LOGENTRY_LIST = _LOGENTRY.nested_types_by_name['List']
+_LOGENTRY_SEVERITY = _LOGENTRY.nested_types_by_name['Severity']
+_LOGCONTROL = DESCRIPTOR.message_types_by_name['LogControl']
+_STARTWORKERREQUEST = DESCRIPTOR.message_types_by_name['StartWorkerRequest']
+_STARTWORKERREQUEST_PARAMSENTRY = _STARTWORKERREQUEST.nested_types_by_name['ParamsEntry']
+_STARTWORKERRESPONSE = DESCRIPTOR.message_types_by_name['StartWorkerResponse']
+_STOPWORKERREQUEST = DESCRIPTOR.message_types_by_name['StopWorkerRequest']
+_STOPWORKERRESPONSE = DESCRIPTOR.message_types_by_name['StopWorkerResponse']
+_WORKERSTATUSREQUEST = DESCRIPTOR.message_types_by_name['WorkerStatusRequest']
+_WORKERSTATUSRESPONSE = DESCRIPTOR.message_types_by_name['WorkerStatusResponse']
+_LOGENTRY_SEVERITY_ENUM = _LOGENTRY_SEVERITY.enum_types_by_name['Enum']
+RemoteGrpcPort = _reflection.GeneratedProtocolMessageType('RemoteGrpcPort', (_message.Message,), {
+  'DESCRIPTOR' : _REMOTEGRPCPORT,
+  '__module__' : 'beam_fn_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.RemoteGrpcPort)
+  })
+_sym_db.RegisterMessage(RemoteGrpcPort)
+
+GetProcessBundleDescriptorRequest = _reflection.GeneratedProtocolMessageType('GetProcessBundleDescriptorRequest', (_message.Message,), {
+  'DESCRIPTOR' : _GETPROCESSBUNDLEDESCRIPTORREQUEST,
+  '__module__' : 'beam_fn_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.GetProcessBundleDescriptorRequest)
+  })
+_sym_db.RegisterMessage(GetProcessBundleDescriptorRequest)
+
+InstructionRequest = _reflection.GeneratedProtocolMessageType('InstructionRequest', (_message.Message,), {
+  'DESCRIPTOR' : _INSTRUCTIONREQUEST,
+  '__module__' : 'beam_fn_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.InstructionRequest)
+  })
+_sym_db.RegisterMessage(InstructionRequest)
+
+InstructionResponse = _reflection.GeneratedProtocolMessageType('InstructionResponse', (_message.Message,), {
+  'DESCRIPTOR' : _INSTRUCTIONRESPONSE,
+  '__module__' : 'beam_fn_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.InstructionResponse)
+  })
+_sym_db.RegisterMessage(InstructionResponse)
+
+HarnessMonitoringInfosRequest = _reflection.GeneratedProtocolMessageType('HarnessMonitoringInfosRequest', (_message.Message,), {
+  'DESCRIPTOR' : _HARNESSMONITORINGINFOSREQUEST,
+  '__module__' : 'beam_fn_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.HarnessMonitoringInfosRequest)
+  })
+_sym_db.RegisterMessage(HarnessMonitoringInfosRequest)
+
+HarnessMonitoringInfosResponse = _reflection.GeneratedProtocolMessageType('HarnessMonitoringInfosResponse', (_message.Message,), {
+
+  'MonitoringDataEntry' : _reflection.GeneratedProtocolMessageType('MonitoringDataEntry', (_message.Message,), {
+    'DESCRIPTOR' : _HARNESSMONITORINGINFOSRESPONSE_MONITORINGDATAENTRY,
+    '__module__' : 'beam_fn_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.HarnessMonitoringInfosResponse.MonitoringDataEntry)
+    })
+  ,
+  'DESCRIPTOR' : _HARNESSMONITORINGINFOSRESPONSE,
+  '__module__' : 'beam_fn_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.HarnessMonitoringInfosResponse)
+  })
+_sym_db.RegisterMessage(HarnessMonitoringInfosResponse)
+_sym_db.RegisterMessage(HarnessMonitoringInfosResponse.MonitoringDataEntry)
+
+RegisterRequest = _reflection.GeneratedProtocolMessageType('RegisterRequest', (_message.Message,), {
+  'DESCRIPTOR' : _REGISTERREQUEST,
+  '__module__' : 'beam_fn_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.RegisterRequest)
+  })
+_sym_db.RegisterMessage(RegisterRequest)
+
+RegisterResponse = _reflection.GeneratedProtocolMessageType('RegisterResponse', (_message.Message,), {
+  'DESCRIPTOR' : _REGISTERRESPONSE,
+  '__module__' : 'beam_fn_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.RegisterResponse)
+  })
+_sym_db.RegisterMessage(RegisterResponse)
+
+ProcessBundleDescriptor = _reflection.GeneratedProtocolMessageType('ProcessBundleDescriptor', (_message.Message,), {
+
+  'TransformsEntry' : _reflection.GeneratedProtocolMessageType('TransformsEntry', (_message.Message,), {
+    'DESCRIPTOR' : _PROCESSBUNDLEDESCRIPTOR_TRANSFORMSENTRY,
+    '__module__' : 'beam_fn_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.ProcessBundleDescriptor.TransformsEntry)
+    })
+  ,
+
+  'PcollectionsEntry' : _reflection.GeneratedProtocolMessageType('PcollectionsEntry', (_message.Message,), {
+    'DESCRIPTOR' : _PROCESSBUNDLEDESCRIPTOR_PCOLLECTIONSENTRY,
+    '__module__' : 'beam_fn_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.ProcessBundleDescriptor.PcollectionsEntry)
+    })
+  ,
+
+  'WindowingStrategiesEntry' : _reflection.GeneratedProtocolMessageType('WindowingStrategiesEntry', (_message.Message,), {
+    'DESCRIPTOR' : _PROCESSBUNDLEDESCRIPTOR_WINDOWINGSTRATEGIESENTRY,
+    '__module__' : 'beam_fn_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.ProcessBundleDescriptor.WindowingStrategiesEntry)
+    })
+  ,
+
+  'CodersEntry' : _reflection.GeneratedProtocolMessageType('CodersEntry', (_message.Message,), {
+    'DESCRIPTOR' : _PROCESSBUNDLEDESCRIPTOR_CODERSENTRY,
+    '__module__' : 'beam_fn_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.ProcessBundleDescriptor.CodersEntry)
+    })
+  ,
+
+  'EnvironmentsEntry' : _reflection.GeneratedProtocolMessageType('EnvironmentsEntry', (_message.Message,), {
+    'DESCRIPTOR' : _PROCESSBUNDLEDESCRIPTOR_ENVIRONMENTSENTRY,
+    '__module__' : 'beam_fn_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.ProcessBundleDescriptor.EnvironmentsEntry)
+    })
+  ,
+  'DESCRIPTOR' : _PROCESSBUNDLEDESCRIPTOR,
+  '__module__' : 'beam_fn_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.ProcessBundleDescriptor)
+  })
+_sym_db.RegisterMessage(ProcessBundleDescriptor)
+_sym_db.RegisterMessage(ProcessBundleDescriptor.TransformsEntry)
+_sym_db.RegisterMessage(ProcessBundleDescriptor.PcollectionsEntry)
+_sym_db.RegisterMessage(ProcessBundleDescriptor.WindowingStrategiesEntry)
+_sym_db.RegisterMessage(ProcessBundleDescriptor.CodersEntry)
+_sym_db.RegisterMessage(ProcessBundleDescriptor.EnvironmentsEntry)
+
+BundleApplication = _reflection.GeneratedProtocolMessageType('BundleApplication', (_message.Message,), {
+
+  'OutputWatermarksEntry' : _reflection.GeneratedProtocolMessageType('OutputWatermarksEntry', (_message.Message,), {
+    'DESCRIPTOR' : _BUNDLEAPPLICATION_OUTPUTWATERMARKSENTRY,
+    '__module__' : 'beam_fn_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.BundleApplication.OutputWatermarksEntry)
+    })
+  ,
+  'DESCRIPTOR' : _BUNDLEAPPLICATION,
+  '__module__' : 'beam_fn_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.BundleApplication)
+  })
+_sym_db.RegisterMessage(BundleApplication)
+_sym_db.RegisterMessage(BundleApplication.OutputWatermarksEntry)
+
+DelayedBundleApplication = _reflection.GeneratedProtocolMessageType('DelayedBundleApplication', (_message.Message,), {
+  'DESCRIPTOR' : _DELAYEDBUNDLEAPPLICATION,
+  '__module__' : 'beam_fn_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.DelayedBundleApplication)
+  })
+_sym_db.RegisterMessage(DelayedBundleApplication)
+
+ProcessBundleRequest = _reflection.GeneratedProtocolMessageType('ProcessBundleRequest', (_message.Message,), {
+
+  'CacheToken' : _reflection.GeneratedProtocolMessageType('CacheToken', (_message.Message,), {
+
+    'UserState' : _reflection.GeneratedProtocolMessageType('UserState', (_message.Message,), {
+      'DESCRIPTOR' : _PROCESSBUNDLEREQUEST_CACHETOKEN_USERSTATE,
+      '__module__' : 'beam_fn_api_pb2'
+      # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.ProcessBundleRequest.CacheToken.UserState)
+      })
+    ,
+
+    'SideInput' : _reflection.GeneratedProtocolMessageType('SideInput', (_message.Message,), {
+      'DESCRIPTOR' : _PROCESSBUNDLEREQUEST_CACHETOKEN_SIDEINPUT,
+      '__module__' : 'beam_fn_api_pb2'
+      # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.ProcessBundleRequest.CacheToken.SideInput)
+      })
+    ,
+    'DESCRIPTOR' : _PROCESSBUNDLEREQUEST_CACHETOKEN,
+    '__module__' : 'beam_fn_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.ProcessBundleRequest.CacheToken)
+    })
+  ,
+  'DESCRIPTOR' : _PROCESSBUNDLEREQUEST,
+  '__module__' : 'beam_fn_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.ProcessBundleRequest)
+  })
+_sym_db.RegisterMessage(ProcessBundleRequest)
+_sym_db.RegisterMessage(ProcessBundleRequest.CacheToken)
+_sym_db.RegisterMessage(ProcessBundleRequest.CacheToken.UserState)
+_sym_db.RegisterMessage(ProcessBundleRequest.CacheToken.SideInput)
+
+ProcessBundleResponse = _reflection.GeneratedProtocolMessageType('ProcessBundleResponse', (_message.Message,), {
+
+  'MonitoringDataEntry' : _reflection.GeneratedProtocolMessageType('MonitoringDataEntry', (_message.Message,), {
+    'DESCRIPTOR' : _PROCESSBUNDLERESPONSE_MONITORINGDATAENTRY,
+    '__module__' : 'beam_fn_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.ProcessBundleResponse.MonitoringDataEntry)
+    })
+  ,
+  'DESCRIPTOR' : _PROCESSBUNDLERESPONSE,
+  '__module__' : 'beam_fn_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.ProcessBundleResponse)
+  })
+_sym_db.RegisterMessage(ProcessBundleResponse)
+_sym_db.RegisterMessage(ProcessBundleResponse.MonitoringDataEntry)
+
+ProcessBundleProgressRequest = _reflection.GeneratedProtocolMessageType('ProcessBundleProgressRequest', (_message.Message,), {
+  'DESCRIPTOR' : _PROCESSBUNDLEPROGRESSREQUEST,
+  '__module__' : 'beam_fn_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.ProcessBundleProgressRequest)
+  })
+_sym_db.RegisterMessage(ProcessBundleProgressRequest)
+
+MonitoringInfosMetadataRequest = _reflection.GeneratedProtocolMessageType('MonitoringInfosMetadataRequest', (_message.Message,), {
+  'DESCRIPTOR' : _MONITORINGINFOSMETADATAREQUEST,
+  '__module__' : 'beam_fn_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.MonitoringInfosMetadataRequest)
+  })
+_sym_db.RegisterMessage(MonitoringInfosMetadataRequest)
+
+ProcessBundleProgressResponse = _reflection.GeneratedProtocolMessageType('ProcessBundleProgressResponse', (_message.Message,), {
+
+  'MonitoringDataEntry' : _reflection.GeneratedProtocolMessageType('MonitoringDataEntry', (_message.Message,), {
+    'DESCRIPTOR' : _PROCESSBUNDLEPROGRESSRESPONSE_MONITORINGDATAENTRY,
+    '__module__' : 'beam_fn_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.ProcessBundleProgressResponse.MonitoringDataEntry)
+    })
+  ,
+  'DESCRIPTOR' : _PROCESSBUNDLEPROGRESSRESPONSE,
+  '__module__' : 'beam_fn_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.ProcessBundleProgressResponse)
+  })
+_sym_db.RegisterMessage(ProcessBundleProgressResponse)
+_sym_db.RegisterMessage(ProcessBundleProgressResponse.MonitoringDataEntry)
+
+MonitoringInfosMetadataResponse = _reflection.GeneratedProtocolMessageType('MonitoringInfosMetadataResponse', (_message.Message,), {
+
+  'MonitoringInfoEntry' : _reflection.GeneratedProtocolMessageType('MonitoringInfoEntry', (_message.Message,), {
+    'DESCRIPTOR' : _MONITORINGINFOSMETADATARESPONSE_MONITORINGINFOENTRY,
+    '__module__' : 'beam_fn_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.MonitoringInfosMetadataResponse.MonitoringInfoEntry)
+    })
+  ,
+  'DESCRIPTOR' : _MONITORINGINFOSMETADATARESPONSE,
+  '__module__' : 'beam_fn_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.MonitoringInfosMetadataResponse)
+  })
+_sym_db.RegisterMessage(MonitoringInfosMetadataResponse)
+_sym_db.RegisterMessage(MonitoringInfosMetadataResponse.MonitoringInfoEntry)
+
+ProcessBundleSplitRequest = _reflection.GeneratedProtocolMessageType('ProcessBundleSplitRequest', (_message.Message,), {
+
+  'DesiredSplit' : _reflection.GeneratedProtocolMessageType('DesiredSplit', (_message.Message,), {
+    'DESCRIPTOR' : _PROCESSBUNDLESPLITREQUEST_DESIREDSPLIT,
+    '__module__' : 'beam_fn_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.ProcessBundleSplitRequest.DesiredSplit)
+    })
+  ,
+
+  'DesiredSplitsEntry' : _reflection.GeneratedProtocolMessageType('DesiredSplitsEntry', (_message.Message,), {
+    'DESCRIPTOR' : _PROCESSBUNDLESPLITREQUEST_DESIREDSPLITSENTRY,
+    '__module__' : 'beam_fn_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.ProcessBundleSplitRequest.DesiredSplitsEntry)
+    })
+  ,
+  'DESCRIPTOR' : _PROCESSBUNDLESPLITREQUEST,
+  '__module__' : 'beam_fn_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.ProcessBundleSplitRequest)
+  })
+_sym_db.RegisterMessage(ProcessBundleSplitRequest)
+_sym_db.RegisterMessage(ProcessBundleSplitRequest.DesiredSplit)
+_sym_db.RegisterMessage(ProcessBundleSplitRequest.DesiredSplitsEntry)
+
+ProcessBundleSplitResponse = _reflection.GeneratedProtocolMessageType('ProcessBundleSplitResponse', (_message.Message,), {
+
+  'ChannelSplit' : _reflection.GeneratedProtocolMessageType('ChannelSplit', (_message.Message,), {
+    'DESCRIPTOR' : _PROCESSBUNDLESPLITRESPONSE_CHANNELSPLIT,
+    '__module__' : 'beam_fn_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.ProcessBundleSplitResponse.ChannelSplit)
+    })
+  ,
+  'DESCRIPTOR' : _PROCESSBUNDLESPLITRESPONSE,
+  '__module__' : 'beam_fn_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.ProcessBundleSplitResponse)
+  })
+_sym_db.RegisterMessage(ProcessBundleSplitResponse)
+_sym_db.RegisterMessage(ProcessBundleSplitResponse.ChannelSplit)
+
+FinalizeBundleRequest = _reflection.GeneratedProtocolMessageType('FinalizeBundleRequest', (_message.Message,), {
+  'DESCRIPTOR' : _FINALIZEBUNDLEREQUEST,
+  '__module__' : 'beam_fn_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.FinalizeBundleRequest)
+  })
+_sym_db.RegisterMessage(FinalizeBundleRequest)
+
+FinalizeBundleResponse = _reflection.GeneratedProtocolMessageType('FinalizeBundleResponse', (_message.Message,), {
+  'DESCRIPTOR' : _FINALIZEBUNDLERESPONSE,
+  '__module__' : 'beam_fn_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.FinalizeBundleResponse)
+  })
+_sym_db.RegisterMessage(FinalizeBundleResponse)
+
+Elements = _reflection.GeneratedProtocolMessageType('Elements', (_message.Message,), {
+
+  'Data' : _reflection.GeneratedProtocolMessageType('Data', (_message.Message,), {
+    'DESCRIPTOR' : _ELEMENTS_DATA,
+    '__module__' : 'beam_fn_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.Elements.Data)
+    })
+  ,
+
+  'Timers' : _reflection.GeneratedProtocolMessageType('Timers', (_message.Message,), {
+    'DESCRIPTOR' : _ELEMENTS_TIMERS,
+    '__module__' : 'beam_fn_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.Elements.Timers)
+    })
+  ,
+  'DESCRIPTOR' : _ELEMENTS,
+  '__module__' : 'beam_fn_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.Elements)
+  })
+_sym_db.RegisterMessage(Elements)
+_sym_db.RegisterMessage(Elements.Data)
+_sym_db.RegisterMessage(Elements.Timers)
+
+StateRequest = _reflection.GeneratedProtocolMessageType('StateRequest', (_message.Message,), {
+  'DESCRIPTOR' : _STATEREQUEST,
+  '__module__' : 'beam_fn_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.StateRequest)
+  })
+_sym_db.RegisterMessage(StateRequest)
+
+StateResponse = _reflection.GeneratedProtocolMessageType('StateResponse', (_message.Message,), {
+  'DESCRIPTOR' : _STATERESPONSE,
+  '__module__' : 'beam_fn_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.StateResponse)
+  })
+_sym_db.RegisterMessage(StateResponse)
+
+StateKey = _reflection.GeneratedProtocolMessageType('StateKey', (_message.Message,), {
+
+  'Runner' : _reflection.GeneratedProtocolMessageType('Runner', (_message.Message,), {
+    'DESCRIPTOR' : _STATEKEY_RUNNER,
+    '__module__' : 'beam_fn_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.StateKey.Runner)
+    })
+  ,
+
+  'IterableSideInput' : _reflection.GeneratedProtocolMessageType('IterableSideInput', (_message.Message,), {
+    'DESCRIPTOR' : _STATEKEY_ITERABLESIDEINPUT,
+    '__module__' : 'beam_fn_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.StateKey.IterableSideInput)
+    })
+  ,
+
+  'MultimapSideInput' : _reflection.GeneratedProtocolMessageType('MultimapSideInput', (_message.Message,), {
+    'DESCRIPTOR' : _STATEKEY_MULTIMAPSIDEINPUT,
+    '__module__' : 'beam_fn_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.StateKey.MultimapSideInput)
+    })
+  ,
+
+  'MultimapKeysSideInput' : _reflection.GeneratedProtocolMessageType('MultimapKeysSideInput', (_message.Message,), {
+    'DESCRIPTOR' : _STATEKEY_MULTIMAPKEYSSIDEINPUT,
+    '__module__' : 'beam_fn_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.StateKey.MultimapKeysSideInput)
+    })
+  ,
+
+  'BagUserState' : _reflection.GeneratedProtocolMessageType('BagUserState', (_message.Message,), {
+    'DESCRIPTOR' : _STATEKEY_BAGUSERSTATE,
+    '__module__' : 'beam_fn_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.StateKey.BagUserState)
+    })
+  ,
+  'DESCRIPTOR' : _STATEKEY,
+  '__module__' : 'beam_fn_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.StateKey)
+  })
+_sym_db.RegisterMessage(StateKey)
+_sym_db.RegisterMessage(StateKey.Runner)
+_sym_db.RegisterMessage(StateKey.IterableSideInput)
+_sym_db.RegisterMessage(StateKey.MultimapSideInput)
+_sym_db.RegisterMessage(StateKey.MultimapKeysSideInput)
+_sym_db.RegisterMessage(StateKey.BagUserState)
+
+StateGetRequest = _reflection.GeneratedProtocolMessageType('StateGetRequest', (_message.Message,), {
+  'DESCRIPTOR' : _STATEGETREQUEST,
+  '__module__' : 'beam_fn_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.StateGetRequest)
+  })
+_sym_db.RegisterMessage(StateGetRequest)
+
+StateGetResponse = _reflection.GeneratedProtocolMessageType('StateGetResponse', (_message.Message,), {
+  'DESCRIPTOR' : _STATEGETRESPONSE,
+  '__module__' : 'beam_fn_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.StateGetResponse)
+  })
+_sym_db.RegisterMessage(StateGetResponse)
+
+StateAppendRequest = _reflection.GeneratedProtocolMessageType('StateAppendRequest', (_message.Message,), {
+  'DESCRIPTOR' : _STATEAPPENDREQUEST,
+  '__module__' : 'beam_fn_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.StateAppendRequest)
+  })
+_sym_db.RegisterMessage(StateAppendRequest)
+
+StateAppendResponse = _reflection.GeneratedProtocolMessageType('StateAppendResponse', (_message.Message,), {
+  'DESCRIPTOR' : _STATEAPPENDRESPONSE,
+  '__module__' : 'beam_fn_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.StateAppendResponse)
+  })
+_sym_db.RegisterMessage(StateAppendResponse)
+
+StateClearRequest = _reflection.GeneratedProtocolMessageType('StateClearRequest', (_message.Message,), {
+  'DESCRIPTOR' : _STATECLEARREQUEST,
+  '__module__' : 'beam_fn_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.StateClearRequest)
+  })
+_sym_db.RegisterMessage(StateClearRequest)
+
+StateClearResponse = _reflection.GeneratedProtocolMessageType('StateClearResponse', (_message.Message,), {
+  'DESCRIPTOR' : _STATECLEARRESPONSE,
+  '__module__' : 'beam_fn_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.StateClearResponse)
+  })
+_sym_db.RegisterMessage(StateClearResponse)
+
+LogEntry = _reflection.GeneratedProtocolMessageType('LogEntry', (_message.Message,), {
+
+  'List' : _reflection.GeneratedProtocolMessageType('List', (_message.Message,), {
+    'DESCRIPTOR' : _LOGENTRY_LIST,
+    '__module__' : 'beam_fn_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.LogEntry.List)
+    })
+  ,
+
+  'Severity' : _reflection.GeneratedProtocolMessageType('Severity', (_message.Message,), {
+    'DESCRIPTOR' : _LOGENTRY_SEVERITY,
+    '__module__' : 'beam_fn_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.LogEntry.Severity)
+    })
+  ,
+  'DESCRIPTOR' : _LOGENTRY,
+  '__module__' : 'beam_fn_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.LogEntry)
+  })
+_sym_db.RegisterMessage(LogEntry)
+_sym_db.RegisterMessage(LogEntry.List)
+_sym_db.RegisterMessage(LogEntry.Severity)
+
+LogControl = _reflection.GeneratedProtocolMessageType('LogControl', (_message.Message,), {
+  'DESCRIPTOR' : _LOGCONTROL,
+  '__module__' : 'beam_fn_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.LogControl)
+  })
+_sym_db.RegisterMessage(LogControl)
+
+StartWorkerRequest = _reflection.GeneratedProtocolMessageType('StartWorkerRequest', (_message.Message,), {
+
+  'ParamsEntry' : _reflection.GeneratedProtocolMessageType('ParamsEntry', (_message.Message,), {
+    'DESCRIPTOR' : _STARTWORKERREQUEST_PARAMSENTRY,
+    '__module__' : 'beam_fn_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.StartWorkerRequest.ParamsEntry)
+    })
+  ,
+  'DESCRIPTOR' : _STARTWORKERREQUEST,
+  '__module__' : 'beam_fn_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.StartWorkerRequest)
+  })
+_sym_db.RegisterMessage(StartWorkerRequest)
+_sym_db.RegisterMessage(StartWorkerRequest.ParamsEntry)
+
+StartWorkerResponse = _reflection.GeneratedProtocolMessageType('StartWorkerResponse', (_message.Message,), {
+  'DESCRIPTOR' : _STARTWORKERRESPONSE,
+  '__module__' : 'beam_fn_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.StartWorkerResponse)
+  })
+_sym_db.RegisterMessage(StartWorkerResponse)
+
+StopWorkerRequest = _reflection.GeneratedProtocolMessageType('StopWorkerRequest', (_message.Message,), {
+  'DESCRIPTOR' : _STOPWORKERREQUEST,
+  '__module__' : 'beam_fn_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.StopWorkerRequest)
+  })
+_sym_db.RegisterMessage(StopWorkerRequest)
+
+StopWorkerResponse = _reflection.GeneratedProtocolMessageType('StopWorkerResponse', (_message.Message,), {
+  'DESCRIPTOR' : _STOPWORKERRESPONSE,
+  '__module__' : 'beam_fn_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.StopWorkerResponse)
+  })
+_sym_db.RegisterMessage(StopWorkerResponse)
+
+WorkerStatusRequest = _reflection.GeneratedProtocolMessageType('WorkerStatusRequest', (_message.Message,), {
+  'DESCRIPTOR' : _WORKERSTATUSREQUEST,
+  '__module__' : 'beam_fn_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.WorkerStatusRequest)
+  })
+_sym_db.RegisterMessage(WorkerStatusRequest)
+
+WorkerStatusResponse = _reflection.GeneratedProtocolMessageType('WorkerStatusResponse', (_message.Message,), {
+  'DESCRIPTOR' : _WORKERSTATUSRESPONSE,
+  '__module__' : 'beam_fn_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.WorkerStatusResponse)
+  })
+_sym_db.RegisterMessage(WorkerStatusResponse)
+
+_BEAMFNCONTROL = DESCRIPTOR.services_by_name['BeamFnControl']
+_BEAMFNDATA = DESCRIPTOR.services_by_name['BeamFnData']
+_BEAMFNSTATE = DESCRIPTOR.services_by_name['BeamFnState']
+_BEAMFNLOGGING = DESCRIPTOR.services_by_name['BeamFnLogging']
+_BEAMFNEXTERNALWORKERPOOL = DESCRIPTOR.services_by_name['BeamFnExternalWorkerPool']
+_BEAMFNWORKERSTATUS = DESCRIPTOR.services_by_name['BeamFnWorkerStatus']
+if _descriptor._USE_C_DESCRIPTORS == False:
+
+  DESCRIPTOR._options = None
+  DESCRIPTOR._serialized_options = b'\n$org.apache.beam.model.fnexecution.v1B\tBeamFnApiZKgithub.com/apache/beam/sdks/go/pkg/beam/model/fnexecution_v1;fnexecution_v1'
+  _HARNESSMONITORINGINFOSRESPONSE_MONITORINGDATAENTRY._options = None
+  _HARNESSMONITORINGINFOSRESPONSE_MONITORINGDATAENTRY._serialized_options = b'8\001'
+  _PROCESSBUNDLEDESCRIPTOR_TRANSFORMSENTRY._options = None
+  _PROCESSBUNDLEDESCRIPTOR_TRANSFORMSENTRY._serialized_options = b'8\001'
+  _PROCESSBUNDLEDESCRIPTOR_PCOLLECTIONSENTRY._options = None
+  _PROCESSBUNDLEDESCRIPTOR_PCOLLECTIONSENTRY._serialized_options = b'8\001'
+  _PROCESSBUNDLEDESCRIPTOR_WINDOWINGSTRATEGIESENTRY._options = None
+  _PROCESSBUNDLEDESCRIPTOR_WINDOWINGSTRATEGIESENTRY._serialized_options = b'8\001'
+  _PROCESSBUNDLEDESCRIPTOR_CODERSENTRY._options = None
+  _PROCESSBUNDLEDESCRIPTOR_CODERSENTRY._serialized_options = b'8\001'
+  _PROCESSBUNDLEDESCRIPTOR_ENVIRONMENTSENTRY._options = None
+  _PROCESSBUNDLEDESCRIPTOR_ENVIRONMENTSENTRY._serialized_options = b'8\001'
+  _BUNDLEAPPLICATION_OUTPUTWATERMARKSENTRY._options = None
+  _BUNDLEAPPLICATION_OUTPUTWATERMARKSENTRY._serialized_options = b'8\001'
+  _PROCESSBUNDLERESPONSE_MONITORINGDATAENTRY._options = None
+  _PROCESSBUNDLERESPONSE_MONITORINGDATAENTRY._serialized_options = b'8\001'
+  _PROCESSBUNDLEPROGRESSRESPONSE_MONITORINGDATAENTRY._options = None
+  _PROCESSBUNDLEPROGRESSRESPONSE_MONITORINGDATAENTRY._serialized_options = b'8\001'
+  _MONITORINGINFOSMETADATARESPONSE_MONITORINGINFOENTRY._options = None
+  _MONITORINGINFOSMETADATARESPONSE_MONITORINGINFOENTRY._serialized_options = b'8\001'
+  _PROCESSBUNDLESPLITREQUEST_DESIREDSPLITSENTRY._options = None
+  _PROCESSBUNDLESPLITREQUEST_DESIREDSPLITSENTRY._serialized_options = b'8\001'
+  _STARTWORKERREQUEST_PARAMSENTRY._options = None
+  _STARTWORKERREQUEST_PARAMSENTRY._serialized_options = b'8\001'
+  _REMOTEGRPCPORT._serialized_start=214
+  _REMOTEGRPCPORT._serialized_end=337
+  _GETPROCESSBUNDLEDESCRIPTORREQUEST._serialized_start=339
+  _GETPROCESSBUNDLEDESCRIPTORREQUEST._serialized_end=412
+  _INSTRUCTIONREQUEST._serialized_start=415
+  _INSTRUCTIONREQUEST._serialized_end=1136
+  _INSTRUCTIONRESPONSE._serialized_start=1139
+  _INSTRUCTIONRESPONSE._serialized_end=1884
+  _HARNESSMONITORINGINFOSREQUEST._serialized_start=1886
+  _HARNESSMONITORINGINFOSREQUEST._serialized_end=1917
+  _HARNESSMONITORINGINFOSRESPONSE._serialized_start=1920
+  _HARNESSMONITORINGINFOSRESPONSE._serialized_end=2123
+  _HARNESSMONITORINGINFOSRESPONSE_MONITORINGDATAENTRY._serialized_start=2070
+  _HARNESSMONITORINGINFOSRESPONSE_MONITORINGDATAENTRY._serialized_end=2123
+  _REGISTERREQUEST._serialized_start=2125
+  _REGISTERREQUEST._serialized_end=2241
+  _REGISTERRESPONSE._serialized_start=2243
+  _REGISTERRESPONSE._serialized_end=2261
+  _PROCESSBUNDLEDESCRIPTOR._serialized_start=2264
+  _PROCESSBUNDLEDESCRIPTOR._serialized_end=3513
+  _PROCESSBUNDLEDESCRIPTOR_TRANSFORMSENTRY._serialized_start=3012
+  _PROCESSBUNDLEDESCRIPTOR_TRANSFORMSENTRY._serialized_end=3108
+  _PROCESSBUNDLEDESCRIPTOR_PCOLLECTIONSENTRY._serialized_start=3110
+  _PROCESSBUNDLEDESCRIPTOR_PCOLLECTIONSENTRY._serialized_end=3209
+  _PROCESSBUNDLEDESCRIPTOR_WINDOWINGSTRATEGIESENTRY._serialized_start=3211
+  _PROCESSBUNDLEDESCRIPTOR_WINDOWINGSTRATEGIESENTRY._serialized_end=3323
+  _PROCESSBUNDLEDESCRIPTOR_CODERSENTRY._serialized_start=3325
+  _PROCESSBUNDLEDESCRIPTOR_CODERSENTRY._serialized_end=3412
+  _PROCESSBUNDLEDESCRIPTOR_ENVIRONMENTSENTRY._serialized_start=3414
+  _PROCESSBUNDLEDESCRIPTOR_ENVIRONMENTSENTRY._serialized_end=3513
+  _BUNDLEAPPLICATION._serialized_start=3516
+  _BUNDLEAPPLICATION._serialized_end=3855
+  _BUNDLEAPPLICATION_OUTPUTWATERMARKSENTRY._serialized_start=3772
+  _BUNDLEAPPLICATION_OUTPUTWATERMARKSENTRY._serialized_end=3855
+  _DELAYEDBUNDLEAPPLICATION._serialized_start=3858
+  _DELAYEDBUNDLEAPPLICATION._serialized_end=4020
+  _PROCESSBUNDLEREQUEST._serialized_start=4023
+  _PROCESSBUNDLEREQUEST._serialized_end=4494
+  _PROCESSBUNDLEREQUEST_CACHETOKEN._serialized_start=4180
+  _PROCESSBUNDLEREQUEST_CACHETOKEN._serialized_end=4494
+  _PROCESSBUNDLEREQUEST_CACHETOKEN_USERSTATE._serialized_start=4417
+  _PROCESSBUNDLEREQUEST_CACHETOKEN_USERSTATE._serialized_end=4428
+  _PROCESSBUNDLEREQUEST_CACHETOKEN_SIDEINPUT._serialized_start=4430
+  _PROCESSBUNDLEREQUEST_CACHETOKEN_SIDEINPUT._serialized_end=4486
+  _PROCESSBUNDLERESPONSE._serialized_start=4497
+  _PROCESSBUNDLERESPONSE._serialized_end=4885
+  _PROCESSBUNDLERESPONSE_MONITORINGDATAENTRY._serialized_start=2070
+  _PROCESSBUNDLERESPONSE_MONITORINGDATAENTRY._serialized_end=2123
+  _PROCESSBUNDLEPROGRESSREQUEST._serialized_start=4887
+  _PROCESSBUNDLEPROGRESSREQUEST._serialized_end=4941
+  _MONITORINGINFOSMETADATAREQUEST._serialized_start=4943
+  _MONITORINGINFOSMETADATAREQUEST._serialized_end=5003
+  _PROCESSBUNDLEPROGRESSRESPONSE._serialized_start=5006
+  _PROCESSBUNDLEPROGRESSRESPONSE._serialized_end=5302
+  _PROCESSBUNDLEPROGRESSRESPONSE_MONITORINGDATAENTRY._serialized_start=2070
+  _PROCESSBUNDLEPROGRESSRESPONSE_MONITORINGDATAENTRY._serialized_end=2123
+  _MONITORINGINFOSMETADATARESPONSE._serialized_start=5305
+  _MONITORINGINFOSMETADATARESPONSE._serialized_end=5561
+  _MONITORINGINFOSMETADATARESPONSE_MONITORINGINFOENTRY._serialized_start=5457
+  _MONITORINGINFOSMETADATARESPONSE_MONITORINGINFOENTRY._serialized_end=5561
+  _PROCESSBUNDLESPLITREQUEST._serialized_start=5564
+  _PROCESSBUNDLESPLITREQUEST._serialized_end=5969
+  _PROCESSBUNDLESPLITREQUEST_DESIREDSPLIT._serialized_start=5726
+  _PROCESSBUNDLESPLITREQUEST_DESIREDSPLIT._serialized_end=5835
+  _PROCESSBUNDLESPLITREQUEST_DESIREDSPLITSENTRY._serialized_start=5838
+  _PROCESSBUNDLESPLITREQUEST_DESIREDSPLITSENTRY._serialized_end=5969
+  _PROCESSBUNDLESPLITRESPONSE._serialized_start=5972
+  _PROCESSBUNDLESPLITRESPONSE._serialized_end=6374
+  _PROCESSBUNDLESPLITRESPONSE_CHANNELSPLIT._serialized_start=6276
+  _PROCESSBUNDLESPLITRESPONSE_CHANNELSPLIT._serialized_end=6374
+  _FINALIZEBUNDLEREQUEST._serialized_start=6376
+  _FINALIZEBUNDLEREQUEST._serialized_end=6423
+  _FINALIZEBUNDLERESPONSE._serialized_start=6425
+  _FINALIZEBUNDLERESPONSE._serialized_end=6449
+  _ELEMENTS._serialized_start=6452
+  _ELEMENTS._serialized_end=6801
+  _ELEMENTS_DATA._serialized_start=6604
+  _ELEMENTS_DATA._serialized_end=6687
+  _ELEMENTS_TIMERS._serialized_start=6689
+  _ELEMENTS_TIMERS._serialized_end=6801
+  _STATEREQUEST._serialized_start=6804
+  _STATEREQUEST._serialized_end=7159
+  _STATERESPONSE._serialized_start=7162
+  _STATERESPONSE._serialized_end=7445
+  _STATEKEY._serialized_start=7448
+  _STATEKEY._serialized_end=8307
+  _STATEKEY_RUNNER._serialized_start=7925
+  _STATEKEY_RUNNER._serialized_end=7946
+  _STATEKEY_ITERABLESIDEINPUT._serialized_start=7948
+  _STATEKEY_ITERABLESIDEINPUT._serialized_end=8028
+  _STATEKEY_MULTIMAPSIDEINPUT._serialized_start=8030
+  _STATEKEY_MULTIMAPSIDEINPUT._serialized_end=8123
+  _STATEKEY_MULTIMAPKEYSSIDEINPUT._serialized_start=8125
+  _STATEKEY_MULTIMAPKEYSSIDEINPUT._serialized_end=8209
+  _STATEKEY_BAGUSERSTATE._serialized_start=8211
+  _STATEKEY_BAGUSERSTATE._serialized_end=8299
+  _STATEGETREQUEST._serialized_start=8309
+  _STATEGETREQUEST._serialized_end=8354
+  _STATEGETRESPONSE._serialized_start=8356
+  _STATEGETRESPONSE._serialized_end=8416
+  _STATEAPPENDREQUEST._serialized_start=8418
+  _STATEAPPENDREQUEST._serialized_end=8452
+  _STATEAPPENDRESPONSE._serialized_start=8454
+  _STATEAPPENDRESPONSE._serialized_end=8475
+  _STATECLEARREQUEST._serialized_start=8477
+  _STATECLEARREQUEST._serialized_end=8496
+  _STATECLEARRESPONSE._serialized_start=8498
+  _STATECLEARRESPONSE._serialized_end=8518
+  _LOGENTRY._serialized_start=8521
+  _LOGENTRY._serialized_end=8969
+  _LOGENTRY_LIST._serialized_start=8777
+  _LOGENTRY_LIST._serialized_end=8853
+  _LOGENTRY_SEVERITY._serialized_start=8855
+  _LOGENTRY_SEVERITY._serialized_end=8969
+  _LOGENTRY_SEVERITY_ENUM._serialized_start=8867
+  _LOGENTRY_SEVERITY_ENUM._serialized_end=8969
+  _LOGCONTROL._serialized_start=8971
+  _LOGCONTROL._serialized_end=8983
+  _STARTWORKERREQUEST._serialized_start=8986
+  _STARTWORKERREQUEST._serialized_end=9494
+  _STARTWORKERREQUEST_PARAMSENTRY._serialized_start=9449
+  _STARTWORKERREQUEST_PARAMSENTRY._serialized_end=9494
+  _STARTWORKERRESPONSE._serialized_start=9496
+  _STARTWORKERRESPONSE._serialized_end=9532
+  _STOPWORKERREQUEST._serialized_start=9534
+  _STOPWORKERREQUEST._serialized_end=9572
+  _STOPWORKERRESPONSE._serialized_start=9574
+  _STOPWORKERRESPONSE._serialized_end=9609
+  _WORKERSTATUSREQUEST._serialized_start=9611
+  _WORKERSTATUSREQUEST._serialized_end=9644
+  _WORKERSTATUSRESPONSE._serialized_start=9646
+  _WORKERSTATUSRESPONSE._serialized_end=9716
+  _BEAMFNCONTROL._serialized_start=9719
+  _BEAMFNCONTROL._serialized_end=10042
+  _BEAMFNDATA._serialized_start=10044
+  _BEAMFNDATA._serialized_end=10168
+  _BEAMFNSTATE._serialized_start=10171
+  _BEAMFNSTATE._serialized_end=10306
+  _BEAMFNLOGGING._serialized_start=10309
+  _BEAMFNLOGGING._serialized_end=10446
+  _BEAMFNEXTERNALWORKERPOOL._serialized_start=10449
+  _BEAMFNEXTERNALWORKERPOOL._serialized_end=10746
+  _BEAMFNWORKERSTATUS._serialized_start=10749
+  _BEAMFNWORKERSTATUS._serialized_end=10913
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: beam_interactive_api.proto
+"""Generated protocol buffer code."""
+from __future__ import absolute_import
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import message as _message
+from google.protobuf import reflection as _reflection
+from google.protobuf import symbol_database as _symbol_database
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from . import beam_runner_api_pb2 as beam__runner__api__pb2
+from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x1a\x62\x65\x61m_interactive_api.proto\x12$org.apache.beam.model.interactive.v1\x1a\x15\x62\x65\x61m_runner_api.proto\x1a\x1fgoogle/protobuf/timestamp.proto\"#\n\x14TestStreamFileHeader\x12\x0b\n\x03tag\x18\x01 \x01(\t\"j\n\x14TestStreamFileRecord\x12R\n\x0erecorded_event\x18\x01 \x01(\x0b\x32:.org.apache.beam.model.pipeline.v1.TestStreamPayload.EventBF\n$org.apache.beam.model.interactive.v1B\x0eInteractiveApiZ\x0einteractive_v1b\x06proto3')
+
+
+
+_TESTSTREAMFILEHEADER = DESCRIPTOR.message_types_by_name['TestStreamFileHeader']
+_TESTSTREAMFILERECORD = DESCRIPTOR.message_types_by_name['TestStreamFileRecord']
+TestStreamFileHeader = _reflection.GeneratedProtocolMessageType('TestStreamFileHeader', (_message.Message,), {
+  'DESCRIPTOR' : _TESTSTREAMFILEHEADER,
+  '__module__' : 'beam_interactive_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.interactive.v1.TestStreamFileHeader)
+  })
+_sym_db.RegisterMessage(TestStreamFileHeader)
+
+TestStreamFileRecord = _reflection.GeneratedProtocolMessageType('TestStreamFileRecord', (_message.Message,), {
+  'DESCRIPTOR' : _TESTSTREAMFILERECORD,
+  '__module__' : 'beam_interactive_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.interactive.v1.TestStreamFileRecord)
+  })
+_sym_db.RegisterMessage(TestStreamFileRecord)
+
+if _descriptor._USE_C_DESCRIPTORS == False:
+
+  DESCRIPTOR._options = None
+  DESCRIPTOR._serialized_options = b'\n$org.apache.beam.model.interactive.v1B\016InteractiveApiZ\016interactive_v1'
+  _TESTSTREAMFILEHEADER._serialized_start=124
+  _TESTSTREAMFILEHEADER._serialized_end=159
+  _TESTSTREAMFILERECORD._serialized_start=161
+  _TESTSTREAMFILERECORD._serialized_end=267
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: beam_provision_api.proto
+"""Generated protocol buffer code."""
+from __future__ import absolute_import
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import message as _message
+from google.protobuf import reflection as _reflection
+from google.protobuf import symbol_database as _symbol_database
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from . import beam_runner_api_pb2 as beam__runner__api__pb2
+from . import endpoints_pb2 as endpoints__pb2
+from google.protobuf import struct_pb2 as google_dot_protobuf_dot_struct__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x18\x62\x65\x61m_provision_api.proto\x12%org.apache.beam.model.fn_execution.v1\x1a\x15\x62\x65\x61m_runner_api.proto\x1a\x0f\x65ndpoints.proto\x1a\x1cgoogle/protobuf/struct.proto\"\x19\n\x17GetProvisionInfoRequest\"^\n\x18GetProvisionInfoResponse\x12\x42\n\x04info\x18\x01 \x01(\x0b\x32\x34.org.apache.beam.model.fn_execution.v1.ProvisionInfo\"\x99\x05\n\rProvisionInfo\x12\x31\n\x10pipeline_options\x18\x03 \x01(\x0b\x32\x17.google.protobuf.Struct\x12\x17\n\x0fretrieval_token\x18\x06 \x01(\t\x12P\n\x0fstatus_endpoint\x18\x07 \x01(\x0b\x32\x37.org.apache.beam.model.pipeline.v1.ApiServiceDescriptor\x12Q\n\x10logging_endpoint\x18\x08 \x01(\x0b\x32\x37.org.apache.beam.model.pipeline.v1.ApiServiceDescriptor\x12R\n\x11\x61rtifact_endpoint\x18\t \x01(\x0b\x32\x37.org.apache.beam.model.pipeline.v1.ApiServiceDescriptor\x12Q\n\x10\x63ontrol_endpoint\x18\n \x01(\x0b\x32\x37.org.apache.beam.model.pipeline.v1.ApiServiceDescriptor\x12L\n\x0c\x64\x65pendencies\x18\x0b \x03(\x0b\x32\x36.org.apache.beam.model.pipeline.v1.ArtifactInformation\x12\x1b\n\x13runner_capabilities\x18\x0c \x03(\t\x12T\n\x08metadata\x18\r \x03(\x0b\x32\x42.org.apache.beam.model.fn_execution.v1.ProvisionInfo.MetadataEntry\x1a/\n\rMetadataEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\x32\xa8\x01\n\x10ProvisionService\x12\x93\x01\n\x10GetProvisionInfo\x12>.org.apache.beam.model.fn_execution.v1.GetProvisionInfoRequest\x1a?.org.apache.beam.model.fn_execution.v1.GetProvisionInfoResponseB\x81\x01\n$org.apache.beam.model.fnexecution.v1B\x0cProvisionApiZKgithub.com/apache/beam/sdks/go/pkg/beam/model/fnexecution_v1;fnexecution_v1b\x06proto3')
+
+
+
+_GETPROVISIONINFOREQUEST = DESCRIPTOR.message_types_by_name['GetProvisionInfoRequest']
+_GETPROVISIONINFORESPONSE = DESCRIPTOR.message_types_by_name['GetProvisionInfoResponse']
+_PROVISIONINFO = DESCRIPTOR.message_types_by_name['ProvisionInfo']
+_PROVISIONINFO_METADATAENTRY = _PROVISIONINFO.nested_types_by_name['MetadataEntry']
+GetProvisionInfoRequest = _reflection.GeneratedProtocolMessageType('GetProvisionInfoRequest', (_message.Message,), {
+  'DESCRIPTOR' : _GETPROVISIONINFOREQUEST,
+  '__module__' : 'beam_provision_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.GetProvisionInfoRequest)
+  })
+_sym_db.RegisterMessage(GetProvisionInfoRequest)
+
+GetProvisionInfoResponse = _reflection.GeneratedProtocolMessageType('GetProvisionInfoResponse', (_message.Message,), {
+  'DESCRIPTOR' : _GETPROVISIONINFORESPONSE,
+  '__module__' : 'beam_provision_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.GetProvisionInfoResponse)
+  })
+_sym_db.RegisterMessage(GetProvisionInfoResponse)
+
+ProvisionInfo = _reflection.GeneratedProtocolMessageType('ProvisionInfo', (_message.Message,), {
+
+  'MetadataEntry' : _reflection.GeneratedProtocolMessageType('MetadataEntry', (_message.Message,), {
+    'DESCRIPTOR' : _PROVISIONINFO_METADATAENTRY,
+    '__module__' : 'beam_provision_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.ProvisionInfo.MetadataEntry)
+    })
+  ,
+  'DESCRIPTOR' : _PROVISIONINFO,
+  '__module__' : 'beam_provision_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.fn_execution.v1.ProvisionInfo)
+  })
+_sym_db.RegisterMessage(ProvisionInfo)
+_sym_db.RegisterMessage(ProvisionInfo.MetadataEntry)
+
+_PROVISIONSERVICE = DESCRIPTOR.services_by_name['ProvisionService']
+if _descriptor._USE_C_DESCRIPTORS == False:
+
+  DESCRIPTOR._options = None
+  DESCRIPTOR._serialized_options = b'\n$org.apache.beam.model.fnexecution.v1B\014ProvisionApiZKgithub.com/apache/beam/sdks/go/pkg/beam/model/fnexecution_v1;fnexecution_v1'
+  _PROVISIONINFO_METADATAENTRY._options = None
+  _PROVISIONINFO_METADATAENTRY._serialized_options = b'8\001'
+  _GETPROVISIONINFOREQUEST._serialized_start=137
+  _GETPROVISIONINFOREQUEST._serialized_end=162
+  _GETPROVISIONINFORESPONSE._serialized_start=164
+  _GETPROVISIONINFORESPONSE._serialized_end=258
+  _PROVISIONINFO._serialized_start=261
+  _PROVISIONINFO._serialized_end=926
+  _PROVISIONINFO_METADATAENTRY._serialized_start=879
+  _PROVISIONINFO_METADATAENTRY._serialized_end=926
+  _PROVISIONSERVICE._serialized_start=929
+  _PROVISIONSERVICE._serialized_end=1097
+# @@protoc_insertion_point(module_scope)
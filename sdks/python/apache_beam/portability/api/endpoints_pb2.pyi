@@ -0,0 +1,79 @@
+# @generated by generate_proto_mypy_stubs.py.  Do not edit!
+import sys
+from google.protobuf.descriptor import (
+    Descriptor as google___protobuf___descriptor___Descriptor,
+)
+
+from google.protobuf.message import (
+    Message as google___protobuf___message___Message,
+)
+
+from typing import (
+    Optional as typing___Optional,
+    Text as typing___Text,
+    Union as typing___Union,
+)
+
+from typing_extensions import (
+    Literal as typing_extensions___Literal,
+)
+
+
+builtin___bool = bool
+builtin___bytes = bytes
+builtin___float = float
+builtin___int = int
+if sys.version_info < (3,):
+    builtin___buffer = buffer
+    builtin___unicode = unicode
+
+
+class ApiServiceDescriptor(google___protobuf___message___Message):
+    DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+    url = ... # type: typing___Text
+
+    @property
+    def authentication(self) -> AuthenticationSpec: ...
+
+    def __init__(self,
+        *,
+        url : typing___Optional[typing___Text] = None,
+        authentication : typing___Optional[AuthenticationSpec] = None,
+        ) -> None: ...
+    if sys.version_info >= (3,):
+        @classmethod
+        def FromString(cls, s: builtin___bytes) -> ApiServiceDescriptor: ...
+    else:
+        @classmethod
+        def FromString(cls, s: typing___Union[builtin___bytes, builtin___buffer, builtin___unicode]) -> ApiServiceDescriptor: ...
+    def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    if sys.version_info >= (3,):
+        def HasField(self, field_name: typing_extensions___Literal[u"authentication"]) -> builtin___bool: ...
+        def ClearField(self, field_name: typing_extensions___Literal[u"authentication",u"url"]) -> None: ...
+    else:
+        def HasField(self, field_name: typing_extensions___Literal[u"authentication",b"authentication"]) -> builtin___bool: ...
+        def ClearField(self, field_name: typing_extensions___Literal[u"authentication",b"authentication",u"url",b"url"]) -> None: ...
+
+class AuthenticationSpec(google___protobuf___message___Message):
+    DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+    urn = ... # type: typing___Text
+    payload = ... # type: builtin___bytes
+
+    def __init__(self,
+        *,
+        urn : typing___Optional[typing___Text] = None,
+        payload : typing___Optional[builtin___bytes] = None,
+        ) -> None: ...
+    if sys.version_info >= (3,):
+        @classmethod
+        def FromString(cls, s: builtin___bytes) -> AuthenticationSpec: ...
+    else:
+        @classmethod
+        def FromString(cls, s: typing___Union[builtin___bytes, builtin___buffer, builtin___unicode]) -> AuthenticationSpec: ...
+    def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    if sys.version_info >= (3,):
+        def ClearField(self, field_name: typing_extensions___Literal[u"payload",u"urn"]) -> None: ...
+    else:
+        def ClearField(self, field_name: typing_extensions___Literal[u"payload",b"payload",u"urn",b"urn"]) -> None: ...
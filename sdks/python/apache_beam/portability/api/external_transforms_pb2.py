@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: external_transforms.proto
+"""Generated protocol buffer code."""
+from __future__ import absolute_import
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import message as _message
+from google.protobuf import reflection as _reflection
+from google.protobuf import symbol_database as _symbol_database
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from . import schema_pb2 as schema__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x19\x65xternal_transforms.proto\x12!org.apache.beam.model.pipeline.v1\x1a\x0cschema.proto\"j\n\x1c\x45xternalConfigurationPayload\x12\x39\n\x06schema\x18\x01 \x01(\x0b\x32).org.apache.beam.model.pipeline.v1.Schema\x12\x0f\n\x07payload\x18\x02 \x01(\x0c\x42~\n!org.apache.beam.model.pipeline.v1B\x12\x45xternalTransformsZEgithub.com/apache/beam/sdks/go/pkg/beam/model/pipeline_v1;pipeline_v1b\x06proto3')
+
+
+
+_EXTERNALCONFIGURATIONPAYLOAD = DESCRIPTOR.message_types_by_name['ExternalConfigurationPayload']
+ExternalConfigurationPayload = _reflection.GeneratedProtocolMessageType('ExternalConfigurationPayload', (_message.Message,), {
+  'DESCRIPTOR' : _EXTERNALCONFIGURATIONPAYLOAD,
+  '__module__' : 'external_transforms_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.ExternalConfigurationPayload)
+  })
+_sym_db.RegisterMessage(ExternalConfigurationPayload)
+
+if _descriptor._USE_C_DESCRIPTORS == False:
+
+  DESCRIPTOR._options = None
+  DESCRIPTOR._serialized_options = b'\n!org.apache.beam.model.pipeline.v1B\022ExternalTransformsZEgithub.com/apache/beam/sdks/go/pkg/beam/model/pipeline_v1;pipeline_v1'
+  _EXTERNALCONFIGURATIONPAYLOAD._serialized_start=78
+  _EXTERNALCONFIGURATIONPAYLOAD._serialized_end=184
+# @@protoc_insertion_point(module_scope)
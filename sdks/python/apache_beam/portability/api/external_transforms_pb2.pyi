@@ -0,0 +1,59 @@
+# @generated by generate_proto_mypy_stubs.py.  Do not edit!
+import sys
+from google.protobuf.descriptor import (
+    Descriptor as google___protobuf___descriptor___Descriptor,
+)
+
+from google.protobuf.message import (
+    Message as google___protobuf___message___Message,
+)
+
+from schema_pb2 import (
+    Schema as schema_pb2___Schema,
+)
+
+from typing import (
+    Optional as typing___Optional,
+    Union as typing___Union,
+)
+
+from typing_extensions import (
+    Literal as typing_extensions___Literal,
+)
+
+
+builtin___bool = bool
+builtin___bytes = bytes
+builtin___float = float
+builtin___int = int
+if sys.version_info < (3,):
+    builtin___buffer = buffer
+    builtin___unicode = unicode
+
+
+class ExternalConfigurationPayload(google___protobuf___message___Message):
+    DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+    payload = ... # type: builtin___bytes
+
+    @property
+    def schema(self) -> schema_pb2___Schema: ...
+
+    def __init__(self,
+        *,
+        schema : typing___Optional[schema_pb2___Schema] = None,
+        payload : typing___Optional[builtin___bytes] = None,
+        ) -> None: ...
+    if sys.version_info >= (3,):
+        @classmethod
+        def FromString(cls, s: builtin___bytes) -> ExternalConfigurationPayload: ...
+    else:
+        @classmethod
+        def FromString(cls, s: typing___Union[builtin___bytes, builtin___buffer, builtin___unicode]) -> ExternalConfigurationPayload: ...
+    def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    if sys.version_info >= (3,):
+        def HasField(self, field_name: typing_extensions___Literal[u"schema"]) -> builtin___bool: ...
+        def ClearField(self, field_name: typing_extensions___Literal[u"payload",u"schema"]) -> None: ...
+    else:
+        def HasField(self, field_name: typing_extensions___Literal[u"schema",b"schema"]) -> builtin___bool: ...
+        def ClearField(self, field_name: typing_extensions___Literal[u"payload",b"payload",u"schema",b"schema"]) -> None: ...
@@ -23,9 +23,11 @@ import base64
 import bisect
 import collections
 import copy
+import functools
+import itertools
 import json
 import logging
-import random
+import pickle
 import threading
 from typing import TYPE_CHECKING
 from typing import Any
@@ -38,7 +40,9 @@ from typing import Iterable
 from typing import Iterator
 from typing import List
 from typing import Mapping
+from typing import MutableMapping
 from typing import Optional
+from typing import Sequence
 from typing import Set
 from typing import Tuple
 from typing import Type
@@ -48,6 +52,7 @@ from typing import cast
 
 from google.protobuf import duration_pb2
 from google.protobuf import timestamp_pb2
+from google.protobuf import wrappers_pb2
 
 import apache_beam as beam
 from apache_beam import coders
@@ -70,9 +75,11 @@ from apache_beam.transforms import core
 from apache_beam.transforms import sideinputs
 from apache_beam.transforms import userstate
 from apache_beam.transforms import window
+from apache_beam.transforms.window import WindowFn
 from apache_beam.utils import counters
 from apache_beam.utils import proto_utils
 from apache_beam.utils import timestamp
+from apache_beam.utils import windowed_value
 
 if TYPE_CHECKING:
   from google.protobuf import message  # pylint: disable=ungrouped-imports
@@ -84,7 +91,6 @@ if TYPE_CHECKING:
   from apache_beam.runners.worker import sdk_worker
   from apache_beam.transforms.core import Windowing
   from apache_beam.transforms.window import BoundedWindow
-  from apache_beam.utils import windowed_value
 
 # This module is experimental. No backwards-compatibility guarantees.
 T = TypeVar('T')
@@ -151,9 +157,10 @@ class DataOutputOperation(RunnerIOOperation):
 
   def process(self, windowed_value):
     # type: (windowed_value.WindowedValue) -> None
+    output_stream = self.output_stream
     self.windowed_coder_impl.encode_to_stream(
-        windowed_value, self.output_stream, True)
-    self.output_stream.maybe_flush()
+        windowed_value, output_stream, True)
+    output_stream.maybe_flush()
 
   def finish(self):
     # type: () -> None
@@ -212,17 +219,22 @@ class DataInputOperation(RunnerIOOperation):
   def process_encoded(self, encoded_windowed_values):
     # type: (bytes) -> None
     input_stream = coder_impl.create_InputStream(encoded_windowed_values)
-    while input_stream.size() > 0:
-      with self.splitting_lock:
+    # The index must be advanced (and the stop checked) under the lock for
+    # every element, as a split may arrive while any element is in progress.
+    # Bind the loop invariants to locals to keep that per-element cost low.
+    splitting_lock = self.splitting_lock
+    output = self.output
+    decode_from_stream = self.windowed_coder_impl.decode_from_stream
+    stream_size = input_stream.size
+    while stream_size() > 0:
+      with splitting_lock:
         if self.index == self.stop - 1:
           return
         self.index += 1
-      decoded_value = self.windowed_coder_impl.decode_from_stream(
-          input_stream, True)
-      self.output(decoded_value)
+      output(decode_from_stream(input_stream, True))
 
   def monitoring_infos(self, transform_id, tag_to_pcollection_id):
-    # type: (str, Dict[str, str]) -> Dict[FrozenSet, metrics_pb2.MonitoringInfo]
+    # type: (str, Mapping[str, str]) -> Dict[FrozenSet, metrics_pb2.MonitoringInfo]
     all_monitoring_infos = super(DataInputOperation, self).monitoring_infos(
         transform_id, tag_to_pcollection_id)
     read_progress_info = monitoring_infos.int64_counter(
@@ -300,7 +312,8 @@ class DataInputOperation(RunnerIOOperation):
     # pylint: disable=round-builtin
     stop_index = index + max(1, int(round(current_element_progress + keep)))
     if allowed_split_points and stop_index not in allowed_split_points:
-      # Choose the closest allowed split point.
+      # Choose the closest allowed split point. The points come straight from
+      # the split request, which does not guarantee any ordering.
       allowed_split_points = sorted(allowed_split_points)
       closest = bisect.bisect(allowed_split_points, stop_index)
       if closest == 0:
@@ -310,6 +323,7 @@ class DataInputOperation(RunnerIOOperation):
       else:
         prev = allowed_split_points[closest - 1]
         next = allowed_split_points[closest]
+        # Never move the split back to an element that was already processed.
         if index < prev and stop_index - prev < next - stop_index:
           stop_index = prev
         else:
@@ -341,13 +355,17 @@ class _StateBackedIterable(object):
     # type: (...) -> None
     self._state_handler = state_handler
     self._state_key = state_key
-    if isinstance(coder_or_impl, coders.Coder):
-      self._coder_impl = coder_or_impl.get_impl()
-    else:
-      self._coder_impl = coder_or_impl
+    self._coder_or_impl = coder_or_impl
+    # Resolved on first iteration, as many of these are never iterated.
+    self._coder_impl = None  # type: Optional[coder_impl.CoderImpl]
 
   def __iter__(self):
     # type: () -> Iterator[Any]
+    if self._coder_impl is None:
+      if isinstance(self._coder_or_impl, coders.Coder):
+        self._coder_impl = self._coder_or_impl.get_impl()
+      else:
+        self._coder_impl = self._coder_or_impl
     return iter(
         self._state_handler.blocking_get(self._state_key, self._coder_impl))
 
@@ -382,36 +400,36 @@ class StateBackedSideInputMap(object):
     if target_window not in self._cache:
       state_handler = self._state_handler
       access_pattern = self._side_input_data.access_pattern
+      encoded_window = self._target_window_coder.encode(target_window)
 
       if access_pattern == common_urns.side_inputs.ITERABLE.urn:
         state_key = beam_fn_api_pb2.StateKey(
             iterable_side_input=beam_fn_api_pb2.StateKey.IterableSideInput(
                 transform_id=self._transform_id,
                 side_input_id=self._tag,
-                window=self._target_window_coder.encode(target_window)))
+                window=encoded_window))
         raw_view = _StateBackedIterable(
             state_handler, state_key, self._element_coder)
 
       elif access_pattern == common_urns.side_inputs.MULTIMAP.urn:
-        state_key = beam_fn_api_pb2.StateKey(
-            multimap_side_input=beam_fn_api_pb2.StateKey.MultimapSideInput(
-                transform_id=self._transform_id,
-                side_input_id=self._tag,
-                window=self._target_window_coder.encode(target_window),
-                key=b''))
+        transform_id = self._transform_id
+        tag = self._tag
         cache = {}
         key_coder_impl = self._element_coder.key_coder().get_impl()
-        value_coder = self._element_coder.value_coder()
+        value_coder_impl = self._element_coder.value_coder().get_impl()
 
         class MultiMap(object):
           def __getitem__(self, key):
             if key not in cache:
-              keyed_state_key = beam_fn_api_pb2.StateKey()
-              keyed_state_key.CopyFrom(state_key)
-              keyed_state_key.multimap_side_input.key = (
-                  key_coder_impl.encode_nested(key))
+              keyed_state_key = beam_fn_api_pb2.StateKey(
+                  multimap_side_input=beam_fn_api_pb2.StateKey.
+                  MultimapSideInput(
+                      transform_id=transform_id,
+                      side_input_id=tag,
+                      window=encoded_window,
+                      key=key_coder_impl.encode_nested(key)))
               cache[key] = _StateBackedIterable(
-                  state_handler, keyed_state_key, value_coder)
+                  state_handler, keyed_state_key, value_coder_impl)
             return cache[key]
 
           def __reduce__(self):
@@ -443,10 +461,7 @@ class ReadModifyWriteRuntimeState(userstate.ReadModifyWriteRuntimeState):
     self._underlying_bag_state = underlying_bag_state
 
   def read(self):  # type: () -> Any
-    values = list(self._underlying_bag_state.read())
-    if not values:
-      return None
-    return values[0]
+    return next(iter(self._underlying_bag_state.read()), None)
 
   def write(self, value):  # type: (Any) -> None
     self.clear()
@@ -458,14 +473,18 @@ class ReadModifyWriteRuntimeState(userstate.ReadModifyWriteRuntimeState):
   def commit(self):  # type: () -> None
     self._underlying_bag_state.commit()
 
+  def _start_commit(self):  # type: () -> Optional[sdk_worker._Future]
+    return self._underlying_bag_state._start_commit()
+
 
 class CombiningValueRuntimeState(userstate.CombiningValueRuntimeState):
   def __init__(self, underlying_bag_state, combinefn):
-    # type: (userstate.AccumulatingRuntimeState, core.CombineFn) -> None
+    # type: (SynchronousBagRuntimeState, core.CombineFn) -> None
     self._combinefn = combinefn
     self._combinefn.setup()
     self._underlying_bag_state = underlying_bag_state
     self._finalized = False
+    self._add_counter = 0
 
   def _read_accumulator(self, rewrite=True):
     merged_accumulator = self._combinefn.merge_accumulators(
@@ -483,8 +502,9 @@ class CombiningValueRuntimeState(userstate.CombiningValueRuntimeState):
     # type: (Any) -> None
     # Prefer blind writes, but don't let them grow unboundedly.
     # This should be tuned to be much lower, but for now exercise
-    # both paths well.
-    if random.random() < 0.5:
+    # both paths well by alternating between them.
+    self._add_counter += 1
+    if self._add_counter & 1:
       accumulator = self._read_accumulator(False)
       self._underlying_bag_state.clear()
     else:
@@ -499,6 +519,10 @@ class CombiningValueRuntimeState(userstate.CombiningValueRuntimeState):
   def commit(self):
     self._underlying_bag_state.commit()
 
+  def _start_commit(self):
+    # type: () -> Optional[sdk_worker._Future]
+    return self._underlying_bag_state._start_commit()
+
   def finalize(self):
     if not self._finalized:
       self._combinefn.teardown()
@@ -536,17 +560,20 @@ class SynchronousBagRuntimeState(userstate.BagRuntimeState):
     # type: (...) -> None
     self._state_handler = state_handler
     self._state_key = state_key
-    self._value_coder = value_coder
+    self._value_coder_impl = value_coder.get_impl()
     self._cleared = False
     self._added_elements = []  # type: List[Any]
 
   def read(self):
     # type: () -> Iterable[Any]
-    return _ConcatIterable([] if self._cleared else cast(
-        'Iterable[Any]',
+    # Always wrap the added elements so that later adds are visible through
+    # the returned iterable and the internal list is never handed out.
+    if self._cleared:
+      return _ConcatIterable([], self._added_elements)
+    return _ConcatIterable(
         _StateBackedIterable(
-            self._state_handler, self._state_key, self._value_coder)),
-                           self._added_elements)
+            self._state_handler, self._state_key, self._value_coder_impl),
+        self._added_elements)
 
   def add(self, value):
     # type: (Any) -> None
@@ -559,15 +586,25 @@ class SynchronousBagRuntimeState(userstate.BagRuntimeState):
 
   def commit(self):
     # type: () -> None
+    to_await = self._start_commit()
+    if to_await:
+      # To commit, we need to wait on the last state request future to complete.
+      to_await.get()
+
+  def _start_commit(self):
+    # type: () -> Optional[sdk_worker._Future]
+
+    """Sends the requests needed to commit without waiting on them.
+
+    Returns the future of the last request sent, if any.
+    """
     to_await = None
     if self._cleared:
       to_await = self._state_handler.clear(self._state_key)
     if self._added_elements:
       to_await = self._state_handler.extend(
-          self._state_key, self._value_coder.get_impl(), self._added_elements)
-    if to_await:
-      # To commit, we need to wait on the last state request future to complete.
-      to_await.get()
+          self._state_key, self._value_coder_impl, self._added_elements)
+    return to_await
 
 
 class SynchronousSetRuntimeState(userstate.SetRuntimeState):
@@ -580,21 +617,22 @@ class SynchronousSetRuntimeState(userstate.SetRuntimeState):
     # type: (...) -> None
     self._state_handler = state_handler
     self._state_key = state_key
-    self._value_coder = value_coder
+    self._value_coder_impl = value_coder.get_impl()
     self._cleared = False
     self._added_elements = set()  # type: Set[Any]
+    self._add_counter = 0
 
   def _compact_data(self, rewrite=True):
     accumulator = set(
         _ConcatIterable(
             set() if self._cleared else _StateBackedIterable(
-                self._state_handler, self._state_key, self._value_coder),
+                self._state_handler, self._state_key, self._value_coder_impl),
             self._added_elements))
 
     if rewrite and accumulator:
       self._state_handler.clear(self._state_key)
       self._state_handler.extend(
-          self._state_key, self._value_coder.get_impl(), accumulator)
+          self._state_key, self._value_coder_impl, accumulator)
 
       # Since everthing is already committed so we can safely reinitialize
       # added_elements here.
@@ -614,7 +652,8 @@ class SynchronousSetRuntimeState(userstate.SetRuntimeState):
       self._cleared = False
 
     self._added_elements.add(value)
-    if random.random() > 0.5:
+    self._add_counter += 1
+    if self._add_counter & 1:
       self._compact_data()
 
   def clear(self):
@@ -624,18 +663,38 @@ class SynchronousSetRuntimeState(userstate.SetRuntimeState):
 
   def commit(self):
     # type: () -> None
+    to_await = self._start_commit()
+    if to_await:
+      # To commit, we need to wait on the last state request future to complete.
+      to_await.get()
+
+  def _start_commit(self):
+    # type: () -> Optional[sdk_worker._Future]
+
+    """Sends the requests needed to commit without waiting on them.
+
+    Returns the future of the last request sent, if any.
+    """
     to_await = None
     if self._cleared:
       to_await = self._state_handler.clear(self._state_key)
     if self._added_elements:
       to_await = self._state_handler.extend(
-          self._state_key, self._value_coder.get_impl(), self._added_elements)
-    if to_await:
-      # To commit, we need to wait on the last state request future to complete.
-      to_await.get()
+          self._state_key, self._value_coder_impl, self._added_elements)
+    return to_await
 
 
 class OutputTimer(userstate.BaseTimer):
+  __slots__ = (
+      '_key',
+      '_window',
+      '_input_timestamp',
+      '_paneinfo',
+      '_time_domain',
+      '_timer_family_id',
+      '_output_stream',
+      '_timer_coder_impl')
+
   def __init__(self,
                key,
                window,  # type: BoundedWindow
@@ -656,15 +715,18 @@ class OutputTimer(userstate.BaseTimer):
     self._timer_coder_impl = timer_coder_impl
 
   def set(self, ts: timestamp.TimestampTypes, dynamic_timer_tag='') -> None:
-    ts = timestamp.Timestamp.of(ts)
+    if isinstance(ts, timestamp.Timestamp):
+      fire_timestamp = ts
+    else:
+      fire_timestamp = timestamp.Timestamp.of(ts)
     timer = userstate.Timer(
         user_key=self._key,
         dynamic_timer_tag=dynamic_timer_tag,
         windows=(self._window, ),
         clear_bit=False,
-        fire_timestamp=ts,
-        hold_timestamp=ts if TimeDomain.is_event_time(self._time_domain) else
-        self._input_timestamp,
+        fire_timestamp=fire_timestamp,
+        hold_timestamp=fire_timestamp if TimeDomain.is_event_time(
+            self._time_domain) else self._input_timestamp,
         paneinfo=self._paneinfo)
     self._timer_coder_impl.encode_to_stream(timer, self._output_stream, True)
     self._output_stream.maybe_flush()
@@ -684,6 +746,8 @@ class OutputTimer(userstate.BaseTimer):
 
 class TimerInfo(object):
   """A data class to store information related to a timer."""
+  __slots__ = ('timer_coder_impl', 'output_stream')
+
   def __init__(self, timer_coder_impl, output_stream=None):
     self.timer_coder_impl = timer_coder_impl
     self.output_stream = output_stream
@@ -715,6 +779,15 @@ class FnApiUserStateContext(userstate.UserStateContext):
     # A mapping of {timer_family_id: TimerInfo}
     self._timers_info = {}  # type: Dict[str, TimerInfo]
     self._all_states = {}  # type: Dict[tuple, FnApiUserRuntimeStateTypes]
+    # A mapping of {user_state_id: StateKey} with window and key left unset.
+    self._state_key_templates = {}  # type: Dict[str, beam_fn_api_pb2.StateKey]
+    # A mapping of {user_state_id: pickled combine_fn}, or None where the
+    # combine_fn can't be pickled and has to be deep-copied instead.
+    self._pickled_combine_fns = {}  # type: Dict[str, Optional[bytes]]
+    # Encodings of the keys and windows seen in the current bundle, shared by
+    # all the state specs.
+    self._encoded_keys = {}  # type: Dict[Any, bytes]
+    self._encoded_windows = {}  # type: Dict[BoundedWindow, bytes]
 
   def add_timer_info(self, timer_family_id, timer_info):
     # type: (str, TimerInfo) -> None
@@ -755,13 +828,7 @@ class FnApiUserStateContext(userstate.UserStateContext):
                    userstate.ReadModifyWriteStateSpec)):
       bag_state = SynchronousBagRuntimeState(
           self._state_handler,
-          state_key=beam_fn_api_pb2.StateKey(
-              bag_user_state=beam_fn_api_pb2.StateKey.BagUserState(
-                  transform_id=self._transform_id,
-                  user_state_id=state_spec.name,
-                  window=self._window_coder.encode(window),
-                  # State keys are expected in nested encoding format
-                  key=self._key_coder.encode_nested(key))),
+          state_key=self._bag_user_state_key(state_spec, key, window),
           value_coder=state_spec.coder)
       if isinstance(state_spec, userstate.BagStateSpec):
         return bag_state
@@ -769,44 +836,77 @@ class FnApiUserStateContext(userstate.UserStateContext):
         return ReadModifyWriteRuntimeState(bag_state)
       else:
         return CombiningValueRuntimeState(
-            bag_state, copy.deepcopy(state_spec.combine_fn))
+            bag_state, self._copy_combine_fn(state_spec))
     elif isinstance(state_spec, userstate.SetStateSpec):
       return SynchronousSetRuntimeState(
           self._state_handler,
-          state_key=beam_fn_api_pb2.StateKey(
-              bag_user_state=beam_fn_api_pb2.StateKey.BagUserState(
-                  transform_id=self._transform_id,
-                  user_state_id=state_spec.name,
-                  window=self._window_coder.encode(window),
-                  # State keys are expected in nested encoding format
-                  key=self._key_coder.encode_nested(key))),
+          state_key=self._bag_user_state_key(state_spec, key, window),
           value_coder=state_spec.coder)
     else:
       raise NotImplementedError(state_spec)
 
+  def _copy_combine_fn(self, state_spec):
+    # type: (userstate.CombiningValueStateSpec) -> core.CombineFn
+    # Each state needs its own combine_fn, as it is set up and torn down with
+    # the state. Unpickling is considerably cheaper than deepcopy, so pickle
+    # the combine_fn once per spec where possible.
+    try:
+      pickled = self._pickled_combine_fns[state_spec.name]
+    except KeyError:
+      try:
+        pickled = pickle.dumps(state_spec.combine_fn, pickle.HIGHEST_PROTOCOL)
+      except Exception:  # pylint: disable=broad-except
+        pickled = None
+      self._pickled_combine_fns[state_spec.name] = pickled
+    if pickled is None:
+      return copy.deepcopy(state_spec.combine_fn)
+    return pickle.loads(pickled)
+
+  def _bag_user_state_key(self,
+                          state_spec,  # type: userstate.StateSpec
+                          key,
+                          window  # type: BoundedWindow
+                         ):
+    # type: (...) -> beam_fn_api_pb2.StateKey
+    # Only the window and key vary between the state keys of a given spec, so
+    # copy everything else from a template built once per spec.
+    template = self._state_key_templates.get(state_spec.name)
+    if template is None:
+      template = self._state_key_templates[state_spec.name] = (
+          beam_fn_api_pb2.StateKey(
+              bag_user_state=beam_fn_api_pb2.StateKey.BagUserState(
+                  transform_id=self._transform_id,
+                  user_state_id=state_spec.name)))
+    state_key = beam_fn_api_pb2.StateKey()
+    state_key.CopyFrom(template)
+    encoded_window = self._encoded_windows.get(window)
+    if encoded_window is None:
+      encoded_window = self._encoded_windows[window] = (
+          self._window_coder.encode(window))
+    encoded_key = self._encoded_keys.get(key)
+    if encoded_key is None:
+      # State keys are expected in nested encoding format
+      encoded_key = self._encoded_keys[key] = self._key_coder.encode_nested(key)
+    state_key.bag_user_state.window = encoded_window
+    state_key.bag_user_state.key = encoded_key
+    return state_key
+
   def commit(self):
     # type: () -> None
-    for state in self._all_states.values():
-      state.commit()
+    # Send the requests for every state before waiting on any of them, so that
+    # their round trips to the runner overlap.
+    to_await = [state._start_commit() for state in self._all_states.values()]
+    for future in to_await:
+      if future:
+        future.get()
 
   def reset(self):
     # type: () -> None
     for state in self._all_states.values():
       state.finalize()
     self._all_states = {}
-
-
-def memoize(func):
-  cache = {}
-  missing = object()
-
-  def wrapper(*args):
-    result = cache.get(args, missing)
-    if result is missing:
-      result = cache[args] = func(*args)
-    return result
-
-  return wrapper
+    self._encoded_keys = {}
+    self._encoded_windows = {}
 
 
 def only_element(iterable):
@@ -860,6 +960,9 @@ class BundleProcessor(object):
         'fnapi-step-%s' % self.process_bundle_descriptor.id,
         self.counter_factory)
     self.ops = self.create_execution_tree(self.process_bundle_descriptor)
+    # Operations are started consumers first, i.e. in reverse order.
+    self._ops_in_start_order = tuple(
+        reversed(self.ops.values()))  # type: Tuple[operations.DoOperation, ...]
     for op in self.ops.values():
       op.setup()
     self.splitting_lock = threading.Lock()
@@ -878,45 +981,75 @@ class BundleProcessor(object):
 
     self.timers_info = transform_factory.extract_timers_info()
 
-    def is_side_input(transform_proto, tag):
-      if transform_proto.spec.urn == common_urns.primitives.PAR_DO.urn:
-        return tag in proto_utils.parse_Bytes(
-            transform_proto.spec.payload,
-            beam_runner_api_pb2.ParDoPayload).side_inputs
-
     pcoll_consumers = collections.defaultdict(
         list)  # type: DefaultDict[str, List[str]]
     for transform_id, transform_proto in descriptor.transforms.items():
+      if transform_proto.spec.urn == common_urns.primitives.PAR_DO.urn:
+        side_inputs = proto_utils.parse_Bytes(
+            transform_proto.spec.payload, beam_runner_api_pb2.ParDoPayload
+        ).side_inputs  # type: Container[str]
+      else:
+        side_inputs = ()
       for tag, pcoll_id in transform_proto.inputs.items():
-        if not is_side_input(transform_proto, tag):
+        if tag not in side_inputs:
           pcoll_consumers[pcoll_id].append(transform_id)
 
-    @memoize
+    # Read each transform's outputs, and the transforms consuming them, out of
+    # the descriptor once rather than on every visit below.
+    transform_outputs = {
+        transform_id: dict(transform_proto.outputs)
+        for transform_id,
+        transform_proto in descriptor.transforms.items()
+    }  # type: Dict[str, Dict[str, str]]
+    transform_consumers = {
+        transform_id: [
+            consumer for pcoll_id in outputs.values()
+            for consumer in pcoll_consumers[pcoll_id]
+        ]
+        for transform_id,
+        outputs in transform_outputs.items()
+    }  # type: Dict[str, List[str]]
+
+    @functools.lru_cache(maxsize=None)
     def get_operation(transform_id):
       # type: (str) -> operations.Operation
-      transform_consumers = {
+      consumers = {
           tag: [get_operation(op) for op in pcoll_consumers[pcoll_id]]
           for tag,
-          pcoll_id in descriptor.transforms[transform_id].outputs.items()
+          pcoll_id in transform_outputs[transform_id].items()
       }
-      return transform_factory.create_operation(
-          transform_id, transform_consumers)
+      return transform_factory.create_operation(transform_id, consumers)
 
     # Operations must be started (hence returned) in order.
-    @memoize
-    def topological_height(transform_id):
-      # type: (str) -> int
-      return 1 + max([0] + [
-          topological_height(consumer)
-          for pcoll in descriptor.transforms[transform_id].outputs.values()
-          for consumer in pcoll_consumers[pcoll]
-      ])
+    # Order the transforms so that each one follows all of its consumers,
+    # working upwards from those without consumers (Kahn's algorithm), then
+    # reverse that order.
+    transform_producers = collections.defaultdict(
+        list)  # type: DefaultDict[str, List[str]]
+    for transform_id, consumers in transform_consumers.items():
+      for consumer in consumers:
+        transform_producers[consumer].append(transform_id)
+    pending_consumers = {
+        transform_id: len(consumers)
+        for transform_id,
+        consumers in transform_consumers.items()
+    }  # type: Dict[str, int]
+    ready = collections.deque(
+        transform_id for transform_id,
+        count in pending_consumers.items() if not count)
+    ordered_transform_ids = []  # type: List[str]
+    while ready:
+      transform_id = ready.popleft()
+      ordered_transform_ids.append(transform_id)
+      for producer in transform_producers[transform_id]:
+        pending_consumers[producer] -= 1
+        if not pending_consumers[producer]:
+          ready.append(producer)
+    ordered_transform_ids.reverse()
 
     return collections.OrderedDict([(
-        transform_id,
-        cast(operations.DoOperation,
-             get_operation(transform_id))) for transform_id in sorted(
-                 descriptor.transforms, key=topological_height, reverse=True)])
+        transform_id, cast(operations.DoOperation, get_operation(transform_id)))
+                                    for transform_id in ordered_transform_ids])
 
   def reset(self):
     # type: () -> None
@@ -945,7 +1078,7 @@ class BundleProcessor(object):
       execution_context = ExecutionContext()
       self.state_sampler.start()
       # Start all operations.
-      for op in reversed(self.ops.values()):
+      for op in self._ops_in_start_order:
         _LOGGER.debug('start %s', op)
         op.execution_context = execution_context
         op.start()
@@ -954,20 +1087,20 @@ class BundleProcessor(object):
       # both data input and timer input. The data input is identied by
       # transform_id. The data input is identified by
       # (transform_id, timer_family_id).
-      data_channels = collections.defaultdict(
-          list
-      )  # type: DefaultDict[data_plane.DataChannel, List[Union[str, Tuple[str, str]]]]
+      data_channels = {
+      }  # type: Dict[data_plane.DataChannel, List[Union[str, Tuple[str, str]]]]
 
       # Add expected data inputs for each data channel.
-      input_op_by_transform_id = {}
+      data_handlers = {}  # type: Dict[str, Callable[[bytes], None]]
       for input_op in expected_input_ops:
-        data_channels[input_op.data_channel].append(input_op.transform_id)
-        input_op_by_transform_id[input_op.transform_id] = input_op
+        data_channels.setdefault(input_op.data_channel,
+                                 []).append(input_op.transform_id)
+        data_handlers[input_op.transform_id] = input_op.process_encoded
 
       # Update timer_data channel with expected timer inputs.
       if self.timer_data_channel:
-        data_channels[self.timer_data_channel].extend(
-            list(self.timers_info.keys()))
+        data_channels.setdefault(self.timer_data_channel,
+                                 []).extend(self.timers_info)
 
         # Set up timer output stream for DoOperation.
         for ((transform_id, timer_family_id),
@@ -977,21 +1110,26 @@ class BundleProcessor(object):
           timer_info.output_stream = output_stream
           self.ops[transform_id].add_timer_info(timer_family_id, timer_info)
 
+      # Resolve the handler of each input once, rather than per element.
+      timer_handlers = {
+          (transform_id, timer_family_id):
+          (timer_info.timer_coder_impl, self.ops[transform_id].process_timer)
+          for (transform_id, timer_family_id),
+          timer_info in self.timers_info.items()
+      }
+
       # Process data and timer inputs
       for data_channel, expected_inputs in data_channels.items():
         for element in data_channel.input_elements(instruction_id,
                                                    expected_inputs):
           if isinstance(element, beam_fn_api_pb2.Elements.Timers):
-            timer_coder_impl = (
-                self.timers_info[(
-                    element.transform_id,
-                    element.timer_family_id)].timer_coder_impl)
+            timer_family_id = element.timer_family_id
+            timer_coder_impl, process_timer = timer_handlers[(
+                element.transform_id, timer_family_id)]
             for timer_data in timer_coder_impl.decode_all(element.timers):
-              self.ops[element.transform_id].process_timer(
-                  element.timer_family_id, timer_data)
+              process_timer(timer_family_id, timer_data)
           elif isinstance(element, beam_fn_api_pb2.Elements.Data):
-            input_op_by_transform_id[element.transform_id].process_encoded(
-                element.data)
+            data_handlers[element.transform_id](element.data)
 
       # Finish all operations.
       for op in self.ops.values():
@@ -1118,11 +1256,11 @@ class BundleProcessor(object):
     """Returns the list of MonitoringInfos collected processing this bundle."""
     # Construct a new dict first to remove duplicates.
     all_monitoring_infos_dict = {}
+    transforms = self.process_bundle_descriptor.transforms
     for transform_id, op in self.ops.items():
-      tag_to_pcollection_id = self.process_bundle_descriptor.transforms[
-          transform_id].outputs
+      # The outputs proto map is passed as is; the operations only read it.
       all_monitoring_infos_dict.update(
-          op.monitoring_infos(transform_id, dict(tag_to_pcollection_id)))
+          op.monitoring_infos(transform_id, transforms[transform_id].outputs))
 
     return list(all_monitoring_infos_dict.values())
 
@@ -1133,6 +1271,8 @@ class BundleProcessor(object):
 
 
 class ExecutionContext(object):
+  __slots__ = ('delayed_applications', )
+
   def __init__(self):
     self.delayed_applications = [
     ]  # type: List[Tuple[operations.DoOperation, common.SplitResultResidual]]
@@ -1160,6 +1300,9 @@ class BeamTransformFactory(object):
             beam_fn_api_pb2.StateKey(
                 runner=beam_fn_api_pb2.StateKey.Runner(key=token)),
             element_coder_impl))
+    # Serialized pickled combine_fns, keyed by their payload. Scoped to this
+    # factory so they are released together with its bundle processor.
+    self.serialized_combine_fns = {}  # type: Dict[bytes, bytes]
 
   _known_urns = {
   }  # type: Dict[str, Tuple[ConstructorFn, Union[Type[message.Message], Type[bytes], None]]]
@@ -1268,7 +1411,7 @@ class BeamTransformFactory(object):
       op,  # type: OperationT
       step_name,  # type: str
       consumers,  # type: Mapping[str, Iterable[operations.Operation]]
-      tag_list=None  # type: Optional[List[str]]
+      tag_list=None  # type: Optional[Sequence[str]]
   ):
     # type: (...) -> OperationT
     op.step_name = step_name
@@ -1403,71 +1546,73 @@ def create_dofn_javasdk(
       factory, transform_id, transform_proto, consumers, serialized_fn)
 
 
+class _PairWithRestrictionDoFn(beam.DoFn):
+  def __init__(self, fn, restriction_provider, watermark_estimator_provider):
+    # The provider methods are bound once here rather than looked up for
+    # every element.
+    self.initial_restriction = restriction_provider.initial_restriction
+    self.initial_estimator_state = (
+        watermark_estimator_provider.initial_estimator_state)
+
+  def process(self, element, *args, **kwargs):
+    # TODO(SDF): Do we want to allow mutation of the element?
+    # (E.g. it could be nice to shift bulky description to the portion
+    # that can be distributed.)
+    initial_restriction = self.initial_restriction(element)
+    initial_estimator_state = self.initial_estimator_state(
+        element, initial_restriction)
+    yield (element, (initial_restriction, initial_estimator_state))
+
+
 @BeamTransformFactory.register_urn(
     common_urns.sdf_components.PAIR_WITH_RESTRICTION.urn,
     beam_runner_api_pb2.ParDoPayload)
 def create_pair_with_restriction(*args):
-  class PairWithRestriction(beam.DoFn):
-    def __init__(self, fn, restriction_provider, watermark_estimator_provider):
-      self.restriction_provider = restriction_provider
-      self.watermark_estimator_provider = watermark_estimator_provider
+  return _create_sdf_operation(_PairWithRestrictionDoFn, *args)
+
 
-    def process(self, element, *args, **kwargs):
-      # TODO(SDF): Do we want to allow mutation of the element?
-      # (E.g. it could be nice to shift bulky description to the portion
-      # that can be distributed.)
-      initial_restriction = self.restriction_provider.initial_restriction(
-          element)
-      initial_estimator_state = (
-          self.watermark_estimator_provider.initial_estimator_state(
-              element, initial_restriction))
-      yield (element, (initial_restriction, initial_estimator_state))
+class _SplitAndSizeRestrictionsDoFn(beam.DoFn):
+  def __init__(self, fn, restriction_provider, watermark_estimator_provider):
+    self.split_and_size = restriction_provider.split_and_size
+    self.initial_estimator_state = (
+        watermark_estimator_provider.initial_estimator_state)
 
-  return _create_sdf_operation(PairWithRestriction, *args)
+  def process(self, element_restriction, *args, **kwargs):
+    element, (restriction, _) = element_restriction
+    initial_estimator_state = self.initial_estimator_state
+    for part, size in self.split_and_size(element, restriction):
+      estimator_state = initial_estimator_state(element, part)
+      yield ((element, (part, estimator_state)), size)
 
 
 @BeamTransformFactory.register_urn(
     common_urns.sdf_components.SPLIT_AND_SIZE_RESTRICTIONS.urn,
     beam_runner_api_pb2.ParDoPayload)
 def create_split_and_size_restrictions(*args):
-  class SplitAndSizeRestrictions(beam.DoFn):
-    def __init__(self, fn, restriction_provider, watermark_estimator_provider):
-      self.restriction_provider = restriction_provider
-      self.watermark_estimator_provider = watermark_estimator_provider
+  return _create_sdf_operation(_SplitAndSizeRestrictionsDoFn, *args)
+
 
-    def process(self, element_restriction, *args, **kwargs):
-      element, (restriction, _) = element_restriction
-      for part, size in self.restriction_provider.split_and_size(
-          element, restriction):
-        estimator_state = (
-            self.watermark_estimator_provider.initial_estimator_state(
-                element, part))
-        yield ((element, (part, estimator_state)), size)
+class _TruncateAndSizeRestrictionDoFn(beam.DoFn):
+  def __init__(self, fn, restriction_provider, watermark_estimator_provider):
+    self.truncate = restriction_provider.truncate
+    self.restriction_size = restriction_provider.restriction_size
 
-  return _create_sdf_operation(SplitAndSizeRestrictions, *args)
+  def process(self, element_restriction, *args, **kwargs):
+    ((element, (restriction, estimator_state)), _) = element_restriction
+    truncated_restriction = self.truncate(element, restriction)
+    if truncated_restriction:
+      truncated_restriction_size = self.restriction_size(
+          element, truncated_restriction)
+      yield ((element, (truncated_restriction, estimator_state)),
+             truncated_restriction_size)
 
 
 @BeamTransformFactory.register_urn(
     common_urns.sdf_components.TRUNCATE_SIZED_RESTRICTION.urn,
     beam_runner_api_pb2.ParDoPayload)
 def create_truncate_sized_restriction(*args):
-  class TruncateAndSizeRestriction(beam.DoFn):
-    def __init__(self, fn, restriction_provider, watermark_estimator_provider):
-      self.restriction_provider = restriction_provider
-
-    def process(self, element_restriction, *args, **kwargs):
-      ((element, (restriction, estimator_state)), _) = element_restriction
-      truncated_restriction = self.restriction_provider.truncate(
-          element, restriction)
-      if truncated_restriction:
-        truncated_restriction_size = (
-            self.restriction_provider.restriction_size(
-                element, truncated_restriction))
-        yield ((element, (truncated_restriction, estimator_state)),
-               truncated_restriction_size)
-
   return _create_sdf_operation(
-      TruncateAndSizeRestriction,
+      _TruncateAndSizeRestrictionDoFn,
       *args,
       operation_cls=operations.SdfTruncateSizedRestrictions)
 
@@ -1504,9 +1649,9 @@ def _create_sdf_operation(
 
   dofn_data = pickler.loads(parameter.do_fn.payload)
   dofn = dofn_data[0]
-  restriction_provider = common.DoFnSignature(dofn).get_restriction_provider()
-  watermark_estimator_provider = (
-      common.DoFnSignature(dofn).get_watermark_estimator_provider())
+  signature = common.DoFnSignature(dofn)
+  restriction_provider = signature.get_restriction_provider()
+  watermark_estimator_provider = signature.get_watermark_estimator_provider()
   serialized_fn = pickler.dumps(
       (proxy_dofn(dofn, restriction_provider, watermark_estimator_provider), ) +
       dofn_data[1:])
@@ -1552,34 +1697,30 @@ def _create_pardo_operation(
 
   if pardo_proto and pardo_proto.side_inputs:
     input_tags_to_coders = factory.get_input_coders(transform_proto)
-    tagged_side_inputs = [
-        (tag, beam.pvalue.SideInputData.from_runner_api(si, factory.context))
-        for tag,
-        si in pardo_proto.side_inputs.items()
-    ]
-    tagged_side_inputs.sort(
-        key=lambda tag_si: sideinputs.get_sideinput_index(tag_si[0]))
+    side_input_tags = sorted(
+        pardo_proto.side_inputs, key=sideinputs.get_sideinput_index)
     side_input_maps = [
         StateBackedSideInputMap(
             factory.state_handler,
             transform_id,
             tag,
-            si,
-            input_tags_to_coders[tag]) for tag,
-        si in tagged_side_inputs
+            beam.pvalue.SideInputData.from_runner_api(
+                pardo_proto.side_inputs[tag], factory.context),
+            input_tags_to_coders[tag]) for tag in side_input_tags
     ]
   else:
     side_input_maps = []
 
-  output_tags = list(transform_proto.outputs.keys())
+  output_tags = tuple(transform_proto.outputs)
 
   dofn_data = pickler.loads(serialized_fn)
   if not dofn_data[-1]:
     # Windowing not set.
     if pardo_proto:
-      other_input_tags = set.union(
-          set(pardo_proto.side_inputs),
-          set(pardo_proto.timer_family_specs))  # type: Container[str]
+      other_input_tags = frozenset(
+          itertools.chain(
+              pardo_proto.side_inputs,
+              pardo_proto.timer_family_specs))  # type: Container[str]
     else:
       other_input_tags = ()
     pcoll_id, = [pcoll for tag, pcoll in transform_proto.inputs.items()
@@ -1620,7 +1761,7 @@ def _create_pardo_operation(
       output_tags=output_tags,
       input=None,
       side_inputs=None,  # Fn API uses proto definitions and the Fn State API
-      output_coders=[output_coders[tag] for tag in output_tags])
+      output_coders=tuple(output_coders[tag] for tag in output_tags))
 
   result = factory.augment_oldstyle_op(
       operation_cls(
@@ -1653,6 +1794,30 @@ def _create_simple_pardo_operation(factory,  # type: BeamTransformFactory
       factory, transform_id, transform_proto, consumers, serialized_fn)
 
 
+class _WindowIntoDoFn(beam.DoFn):
+  def __init__(self, windowing):
+    # type: (core.Windowing) -> None
+    self.windowing = windowing
+    # GlobalWindows assigns every element to the same window, so assign() can
+    # be skipped and a single windows tuple shared.
+    self.global_windows = None  # type: Optional[Tuple[BoundedWindow]]
+    if type(windowing.windowfn) is window.GlobalWindows:
+      self.global_windows = (window.GlobalWindow(), )
+
+  def process(
+      self,
+      element,
+      timestamp=beam.DoFn.TimestampParam,
+      window=beam.DoFn.WindowParam):
+    if self.global_windows is not None:
+      yield windowed_value.WindowedValue(
+          element, timestamp, self.global_windows)
+      return
+    new_windows = self.windowing.windowfn.assign(
+        WindowFn.AssignContext(timestamp, element=element, window=window))
+    yield windowed_value.WindowedValue(element, timestamp, new_windows)
+
+
 @BeamTransformFactory.register_urn(
     common_urns.primitives.ASSIGN_WINDOWS.urn,
     beam_runner_api_pb2.WindowingStrategy)
@@ -1663,28 +1828,13 @@ def create_assign_windows(
     parameter,  # type: beam_runner_api_pb2.WindowingStrategy
     consumers  # type: Dict[str, List[operations.Operation]]
 ):
-  class WindowIntoDoFn(beam.DoFn):
-    def __init__(self, windowing):
-      self.windowing = windowing
-
-    def process(
-        self,
-        element,
-        timestamp=beam.DoFn.TimestampParam,
-        window=beam.DoFn.WindowParam):
-      new_windows = self.windowing.windowfn.assign(
-          WindowFn.AssignContext(timestamp, element=element, window=window))
-      yield WindowedValue(element, timestamp, new_windows)
-
-  from apache_beam.transforms.core import Windowing
-  from apache_beam.transforms.window import WindowFn, WindowedValue
-  windowing = Windowing.from_runner_api(parameter, factory.context)
+  windowing = core.Windowing.from_runner_api(parameter, factory.context)
   return _create_simple_pardo_operation(
       factory,
       transform_id,
       transform_proto,
       consumers,
-      WindowIntoDoFn(windowing))
+      _WindowIntoDoFn(windowing))
 
 
 @BeamTransformFactory.register_urn(IDENTITY_DOFN_URN, None)
@@ -1707,6 +1857,29 @@ def create_identity_dofn(
       consumers)
 
 
+def _serialize_combine_fn(
+    combine_fn_proto,  # type: beam_runner_api_pb2.FunctionSpec
+    factory  # type: BeamTransformFactory
+):
+  # type: (...) -> bytes
+  if combine_fn_proto.urn == python_urns.PICKLED_COMBINE_FN:
+    # Pickled combine_fns don't depend on the pipeline context, so the result
+    # can be shared between the combine phases of this bundle processor.
+    payload = combine_fn_proto.payload
+    serialized_combine_fn = factory.serialized_combine_fns.get(payload)
+    if serialized_combine_fn is None:
+      # The payload is the pickled CombineFn wrapped in a BytesValue.
+      pickled_combine_fn = proto_utils.parse_Bytes(
+          payload, wrappers_pb2.BytesValue).value
+      serialized_combine_fn = pickler.dumps(
+          (pickler.loads(pickled_combine_fn), [], {}))
+      factory.serialized_combine_fns[payload] = serialized_combine_fn
+    return serialized_combine_fn
+  return pickler.dumps((
+      beam.CombineFn.from_runner_api(combine_fn_proto,
+                                     factory.context), [], {}))
+
+
 @BeamTransformFactory.register_urn(
     common_urns.combine_components.COMBINE_PER_KEY_PRECOMBINE.urn,
     beam_runner_api_pb2.CombinePayload)
@@ -1718,9 +1891,7 @@ def create_combine_per_key_precombine(
     consumers  # type: Dict[str, List[operations.Operation]]
 ):
   # type: (...) -> operations.PGBKCVOperation
-  serialized_combine_fn = pickler.dumps((
-      beam.CombineFn.from_runner_api(payload.combine_fn,
-                                     factory.context), [], {}))
+  serialized_combine_fn = _serialize_combine_fn(payload.combine_fn, factory)
   return factory.augment_oldstyle_op(
       operations.PGBKCVOperation(
           common.NameContext(transform_proto.unique_name, transform_id),
@@ -1793,9 +1964,7 @@ def create_combine_grouped_values(
 def _create_combine_phase_operation(
     factory, transform_id, transform_proto, payload, consumers, phase):
   # type: (...) -> operations.CombineOperation
-  serialized_combine_fn = pickler.dumps((
-      beam.CombineFn.from_runner_api(payload.combine_fn,
-                                     factory.context), [], {}))
+  serialized_combine_fn = _serialize_combine_fn(payload.combine_fn, factory)
   return factory.augment_oldstyle_op(
       operations.CombineOperation(
           common.NameContext(transform_proto.unique_name, transform_id),
@@ -1829,6 +1998,15 @@ def create_flatten(
       consumers)
 
 
+class _MapWindowsDoFn(beam.DoFn):
+  def __init__(self, window_mapping_fn):
+    self.window_mapping_fn = window_mapping_fn
+
+  def process(self, element):
+    key, window = element
+    return [(key, self.window_mapping_fn(window))]
+
+
 @BeamTransformFactory.register_urn(
     common_urns.primitives.MAP_WINDOWS.urn, beam_runner_api_pb2.FunctionSpec)
 def create_map_windows(
@@ -1840,14 +2018,58 @@ def create_map_windows(
 ):
   assert mapping_fn_spec.urn == python_urns.PICKLED_WINDOW_MAPPING_FN
   window_mapping_fn = pickler.loads(mapping_fn_spec.payload)
+  return _create_simple_pardo_operation(
+      factory,
+      transform_id,
+      transform_proto,
+      consumers,
+      _MapWindowsDoFn(window_mapping_fn))
 
-  class MapWindows(beam.DoFn):
-    def process(self, element):
-      key, window = element
-      return [(key, window_mapping_fn(window))]
 
-  return _create_simple_pardo_operation(
-      factory, transform_id, transform_proto, consumers, MapWindows())
+class _RecordingMergeContext(WindowFn.MergeContext):
+  def __init__(
+      self,
+      windows,  # type: Iterable[window.BoundedWindow]
+      original_windows,  # type: Set[window.BoundedWindow]
+      merged_windows,  # type: MutableMapping[window.BoundedWindow, Set[window.BoundedWindow]]
+  ):
+    super(_RecordingMergeContext, self).__init__(windows)
+    self.original_windows = original_windows
+    self.merged_windows = merged_windows
+
+  def merge(
+      self,
+      to_be_merged,  # type: Iterable[window.BoundedWindow]
+      merge_result,  # type: window.BoundedWindow
+    ):
+    merged_windows = self.merged_windows
+    originals = merged_windows[merge_result]
+    windows = set(to_be_merged)
+    # Move the windows that have not been merged before in one go; the rest
+    # are earlier merge results whose originals are taken over.
+    unmerged = windows & self.original_windows
+    originals |= unmerged
+    self.original_windows -= unmerged
+    for w in windows - unmerged:
+      originals.update(merged_windows.pop(w))
+
+
+class _MergeWindowsDoFn(beam.DoFn):
+  def __init__(self, window_fn):
+    # type: (WindowFn) -> None
+    self.window_fn = window_fn
+
+  def process(self, element):
+    nonce, windows = element
+
+    original_windows = set(windows)  # type: Set[window.BoundedWindow]
+    merged_windows = collections.defaultdict(
+        set
+    )  # type: MutableMapping[window.BoundedWindow, Set[window.BoundedWindow]]
+
+    self.window_fn.merge(
+        _RecordingMergeContext(windows, original_windows, merged_windows))
+    yield nonce, (original_windows, merged_windows.items())
 
 
 @BeamTransformFactory.register_urn(
@@ -1861,35 +2083,18 @@ def create_merge_windows(
 ):
   assert mapping_fn_spec.urn == python_urns.PICKLED_WINDOWFN
   window_fn = pickler.loads(mapping_fn_spec.payload)
+  return _create_simple_pardo_operation(
+      factory,
+      transform_id,
+      transform_proto,
+      consumers,
+      _MergeWindowsDoFn(window_fn))
 
-  class MergeWindows(beam.DoFn):
-    def process(self, element):
-      nonce, windows = element
-
-      original_windows = set(windows)  # type: Set[window.BoundedWindow]
-      merged_windows = collections.defaultdict(
-          set
-      )  # type: MutableMapping[window.BoundedWindow, Set[window.BoundedWindow]]
-
-      class RecordingMergeContext(window.WindowFn.MergeContext):
-        def merge(
-            self,
-            to_be_merged,  # type: Iterable[window.BoundedWindow]
-            merge_result,  # type: window.BoundedWindow
-          ):
-          originals = merged_windows[merge_result]
-          for window in to_be_merged:
-            if window in original_windows:
-              originals.add(window)
-              original_windows.remove(window)
-            else:
-              originals.update(merged_windows.pop(window))
-
-      window_fn.merge(RecordingMergeContext(windows))
-      yield nonce, (original_windows, merged_windows.items())
 
-  return _create_simple_pardo_operation(
-      factory, transform_id, transform_proto, consumers, MergeWindows())
+class _ToStringDoFn(beam.DoFn):
+  def process(self, element):
+    key, value = element
+    return [(key, str(value))]
 
 
 @BeamTransformFactory.register_urn(common_urns.primitives.TO_STRING.urn, None)
@@ -1900,10 +2105,5 @@ def create_to_string_fn(
     mapping_fn_spec,  # type: beam_runner_api_pb2.FunctionSpec
     consumers  # type: Dict[str, List[operations.Operation]]
 ):
-  class ToString(beam.DoFn):
-    def process(self, element):
-      key, value = element
-      return [(key, str(value))]
-
   return _create_simple_pardo_operation(
-      factory, transform_id, transform_proto, consumers, ToString())
+      factory, transform_id, transform_proto, consumers, _ToStringDoFn())
@@ -20,12 +20,24 @@
 
 import unittest
 
+from apache_beam.coders.coders import GlobalWindowCoder
+from apache_beam.coders.coders import VarIntCoder
 from apache_beam.runners.worker.bundle_processor import DataInputOperation
 from apache_beam.runners.worker.bundle_processor import FnApiUserStateContext
 from apache_beam.runners.worker.bundle_processor import TimerInfo
+from apache_beam.runners.worker.bundle_processor import _MergeWindowsDoFn
+from apache_beam.runners.worker.bundle_processor import _WindowIntoDoFn
 from apache_beam.runners.worker.data_plane import SizeBasedBufferingClosableOutputStream
 from apache_beam.transforms import userstate
+from apache_beam.transforms.combiners import CountCombineFn
+from apache_beam.transforms.core import CombineFn
+from apache_beam.transforms.core import Windowing
+from apache_beam.transforms.window import FixedWindows
 from apache_beam.transforms.window import GlobalWindow
+from apache_beam.transforms.window import GlobalWindows
+from apache_beam.transforms.window import IntervalWindow
+from apache_beam.transforms.window import Sessions
+from apache_beam.utils.timestamp import Timestamp
 
 
 class FnApiUserStateContextTest(unittest.TestCase):
@@ -62,6 +74,102 @@ class FnApiUserStateContextTest(unittest.TestCase):
     # Output timestamp should be equal to the input timestamp
     self.assertEqual(coder.timer.hold_timestamp, 23)
 
+  def testCommitSendsAllRequestsBeforeWaiting(self):
+    events = []
+
+    class Future(object):
+      def __init__(self, name):
+        self.name = name
+
+      def get(self):
+        events.append(('get', self.name))
+
+    class StateHandler(object):
+      """Dummy state handler recording requests and waits."""
+      def clear(self, state_key):
+        events.append(('clear', state_key.bag_user_state.user_state_id))
+        return Future(state_key.bag_user_state.user_state_id)
+
+      def extend(self, state_key, coder_impl, elements):
+        events.append(('extend', state_key.bag_user_state.user_state_id))
+        return Future(state_key.bag_user_state.user_state_id)
+
+    ctx = FnApiUserStateContext(
+        StateHandler(), 'transform_id', VarIntCoder(), GlobalWindowCoder())
+    ctx.get_state(
+        userstate.BagStateSpec('a', VarIntCoder()), 1, GlobalWindow()).add(1)
+    ctx.get_state(
+        userstate.ReadModifyWriteStateSpec('b', VarIntCoder()),
+        1,
+        GlobalWindow()).write(2)
+    ctx.commit()
+    self.assertEqual(
+        events,
+        [('extend', 'a'), ('clear', 'b'), ('extend', 'b'), ('get', 'a'),
+         ('get', 'b')])
+
+  def testBagStateReadSeesLaterAdds(self):
+    class StateHandler(object):
+      """Dummy state handler with a single persisted element."""
+      def blocking_get(self, state_key, coder_impl):
+        return [1]
+
+    ctx = FnApiUserStateContext(
+        StateHandler(), 'transform_id', VarIntCoder(), GlobalWindowCoder())
+    state = ctx.get_state(
+        userstate.BagStateSpec('a', VarIntCoder()), 1, GlobalWindow())
+    contents = state.read()
+    state.add(2)
+    self.assertEqual(list(contents), [1, 2])
+
+    state.clear()
+    contents = state.read()
+    state.add(3)
+    self.assertEqual(list(contents), [3])
+    self.assertNotIsInstance(contents, list)
+
+  def testCombiningStatesGetDistinctCombineFns(self):
+    # The lambda can't be pickled, so is copied via deepcopy instead.
+    for combine_fn in (CountCombineFn(),
+                       CombineFn.from_callable(lambda xs: sum(xs))):
+      ctx = FnApiUserStateContext(
+          None, 'transform_id', VarIntCoder(), GlobalWindowCoder())
+      spec = userstate.CombiningValueStateSpec(
+          'combine', VarIntCoder(), combine_fn)
+      state1 = ctx._create_state(spec, 1, GlobalWindow())
+      state2 = ctx._create_state(spec, 2, GlobalWindow())
+      self.assertIsInstance(state1._combinefn, type(combine_fn))
+      self.assertIsNot(state1._combinefn, combine_fn)
+      self.assertIsNot(state1._combinefn, state2._combinefn)
+
+
+class MergeWindowsTest(unittest.TestCase):
+  def test_merge_sessions(self):
+    windows = [
+        IntervalWindow(0, 10),
+        IntervalWindow(5, 15),
+        IntervalWindow(12, 22),
+        IntervalWindow(30, 40)
+    ]
+    (nonce, (unmerged, merged)), = _MergeWindowsDoFn(Sessions(10)).process(
+        ('nonce', windows))
+    self.assertEqual(nonce, 'nonce')
+    self.assertEqual(unmerged, {IntervalWindow(30, 40)})
+    self.assertEqual(dict(merged), {IntervalWindow(0, 22): set(windows[:3])})
+
+
+class WindowIntoDoFnTest(unittest.TestCase):
+  def test_assign_windows(self):
+    wv, = _WindowIntoDoFn(Windowing(GlobalWindows())).process(
+        'a', timestamp=Timestamp(15), window=GlobalWindow())
+    self.assertEqual(wv.value, 'a')
+    self.assertEqual(wv.timestamp, Timestamp(15))
+    self.assertEqual(list(wv.windows), [GlobalWindow()])
+
+    wv, = _WindowIntoDoFn(Windowing(FixedWindows(10))).process(
+        'a', timestamp=Timestamp(15), window=GlobalWindow())
+    self.assertEqual(list(wv.windows), [IntervalWindow(10, 20)])
+
 
 class SplitTest(unittest.TestCase):
   def split(
@@ -124,6 +232,12 @@ class SplitTest(unittest.TestCase):
     # We have progressed beyond all possible split points, so can't split.
     self.assertEqual(self.split(5, 0, 0.25, 16, allowed=(1, 2, 3)), None)
 
+    # The allowed split points need not be sorted.
+    self.assertEqual(
+        self.split(0, 0, 0.25, 16, allowed=(6, 3, 2)), simple_split(3))
+    # The closer split point has already been processed, so take the next one.
+    self.assertEqual(self.split(3, 0, 0.1, 16, allowed=(3, 6)), simple_split(6))
+
   def test_sdf_split(self):
     # Split between future elements at element boundaries.
     self.assertEqual(self.sdf_split(0, 0, 0.51, 4), simple_split(2))
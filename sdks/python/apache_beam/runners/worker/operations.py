@@ -359,7 +359,7 @@ class Operation(object):
     self.consumers[output_index].append(operation)
 
   def monitoring_infos(self, transform_id, tag_to_pcollection_id):
-    # type: (str, Dict[str, str]) -> Dict[FrozenSet, metrics_pb2.MonitoringInfo]
+    # type: (str, Mapping[str, str]) -> Dict[FrozenSet, metrics_pb2.MonitoringInfo]
 
     """Returns the list of MonitoringInfos collected by this operation."""
     all_monitoring_infos = self.execution_time_monitoring_infos(transform_id)
@@ -369,7 +369,7 @@ class Operation(object):
     return all_monitoring_infos
 
   def pcollection_count_monitoring_infos(self, tag_to_pcollection_id):
-    # type: (Dict[str, str]) -> Dict[FrozenSet, metrics_pb2.MonitoringInfo]
+    # type: (Mapping[str, str]) -> Dict[FrozenSet, metrics_pb2.MonitoringInfo]
 
     """Returns the element count MonitoringInfo collected by this operation."""
 
@@ -763,7 +763,7 @@ class DoOperation(Operation):
     self.dofn_runner.bundle_finalizer_param.reset()
 
   def pcollection_count_monitoring_infos(self, tag_to_pcollection_id):
-    # type: (Dict[str, str]) -> Dict[FrozenSet, metrics_pb2.MonitoringInfo]
+    # type: (Mapping[str, str]) -> Dict[FrozenSet, metrics_pb2.MonitoringInfo]
 
     """Returns the element count MonitoringInfo collected by this operation."""
     infos = super(
@@ -862,7 +862,7 @@ class SdfProcessSizedElements(DoOperation):
       return None
 
   def monitoring_infos(self, transform_id, tag_to_pcollection_id):
-    # type: (str, Dict[str, str]) -> Dict[FrozenSet, metrics_pb2.MonitoringInfo]
+    # type: (str, Mapping[str, str]) -> Dict[FrozenSet, metrics_pb2.MonitoringInfo]
 
     def encode_progress(value):
       # type: (float) -> bytes
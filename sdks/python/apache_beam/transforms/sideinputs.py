@@ -43,6 +43,8 @@ SIDE_INPUT_PREFIX = 'python_side_input'
 
 SIDE_INPUT_REGEX = SIDE_INPUT_PREFIX + '([0-9]+)(-.*)?$'
 
+_SIDE_INPUT_PATTERN = re.compile(SIDE_INPUT_REGEX, re.DOTALL)
+
 
 # Top-level function so we can identify it later.
 def _global_window_mapping_fn(w, global_window=window.GlobalWindow()):
@@ -66,7 +68,7 @@ def default_window_mapping_fn(target_window_fn):
 
 def get_sideinput_index(tag):
   # type: (str) -> int
-  match = re.match(SIDE_INPUT_REGEX, tag, re.DOTALL)
+  match = _SIDE_INPUT_PATTERN.match(tag)
   if match:
     return int(match.group(1))
   else:
@@ -300,6 +300,8 @@ def validate_stateful_dofn(dofn):
 
 
 class BaseTimer(object):
+  __slots__ = ()
+
   def clear(self, dynamic_timer_tag=''):
     # type: (str) -> None
     raise NotImplementedError